@@ -1,6 +1,13 @@
 #!/usr/bin/env python
+import bisect
+import functools
 import itertools
+import os
 import re
+import threading
+import unicodedata
+import weakref
+from collections import OrderedDict
 from contextlib import contextmanager
 from gettext import NullTranslations
 from typing import (
@@ -8,6 +15,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     NamedTuple,
@@ -20,8 +28,10 @@ from typing import (
 )
 
 from asgiref.local import Local
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.utils.encoding import force_str
-from django.utils.translation import override, trans_real
+from django.utils.translation import get_language, override, trans_real
 from typing_extensions import Literal, TypedDict
 
 from django_games.conf import settings
@@ -33,24 +43,113 @@ if TYPE_CHECKING:
 
 try:
     import pyuca  # type: ignore
+except ImportError:
+    pyuca = None
 
-    collator = pyuca.Collator()
+_collator = None
+_collator_lock = threading.Lock()
 
-    # Use UCA sorting if it's available.
-    def sort_key(item: Tuple[str, str]) -> Any:
-        return collator.sort_key(item[1])
 
-except ImportError:
-    # Fallback if the UCA sorting is not available.
-    import unicodedata
+def get_collator():
+    """
+    Return the shared pyuca collator, built the first time it is needed.
 
+    Parsing the full collation table is slow and uses several MB of memory, so
+    it is deferred until something is actually sorted.
+    ``settings.GAMES_COLLATION_TABLE`` can point to a smaller table, such as
+    one trimmed to the characters in game names with
+    ``write_collation_table``.
+    """
+    global _collator
+    if _collator is None:
+        with _collator_lock:
+            if _collator is None:
+                _collator = pyuca.Collator(settings.GAMES_COLLATION_TABLE)
+    return _collator
+
+
+def write_collation_table(filename: str, texts: Iterable[str]) -> int:
+    """
+    Write a copy of pyuca's collation table that only contains the entries
+    needed to sort the given texts.
+
+    Characters that aren't in the table are still sorted (after the others)
+    using their implicit weights.
+
+    :returns: The number of entries written.
+    """
+    characters = set()
+    for text in texts:
+        characters.update(unicodedata.normalize("NFD", text))
+    code_points = {f"{ord(character):04X}" for character in characters}
+    source = os.path.join(
+        os.path.dirname(pyuca.__file__),
+        f"allkeys-{pyuca.Collator.UCA_VERSION}.txt",
+    )
+    count = 0
+    with open(source, encoding="utf-8") as source_file, open(
+        filename, "w", encoding="utf-8"
+    ) as output_file:
+        for line in source_file:
+            entry = line.split("#", 1)[0].strip()
+            if entry and not entry.startswith("@"):
+                if not set(entry.split(";", 1)[0].split()) <= code_points:
+                    continue
+                count += 1
+            output_file.write(line)
+    return count
+
+
+def _uca_key(text: str) -> Any:
+    return get_collator().sort_key(text)
+
+
+def _ascii_key(text: str) -> Any:
     # Cheap and dirty method to sort against ASCII characters only.
-    def sort_key(item: Tuple[str, str]) -> Any:
-        return (
-            unicodedata.normalize("NFKD", item[1])
-            .encode("ascii", "ignore")
-            .decode("ascii")
-        )
+    return (
+        unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    )
+
+
+def _unicode_key(text: str) -> Any:
+    return text.casefold()
+
+
+COLLATIONS: Dict[str, Callable[[str], Any]] = {
+    "uca": _uca_key,
+    "ascii": _ascii_key,
+    "unicode": _unicode_key,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def collation_key(text: str, collation: Optional[str] = None) -> Any:
+    """
+    Return the (memoized) key to sort some text by.
+
+    ``collation`` is one of ``COLLATIONS``. By default, UCA sorting is used if
+    pyuca is installed, otherwise text is sorted against ASCII characters only.
+    """
+    if collation is None:
+        collation = "uca" if pyuca else "ascii"
+    elif collation == "uca" and not pyuca:
+        raise ImproperlyConfigured("pyuca must be installed to use UCA collation.")
+    try:
+        key_func = COLLATIONS[collation]
+    except KeyError:
+        raise ImproperlyConfigured(f"Unknown games collation: {collation!r}") from None
+    return key_func(text)
+
+
+def sort_key(item: Tuple[str, str]) -> Any:
+    return collation_key(item[1])
+
+
+def __getattr__(name: str) -> Any:
+    # The collator used to be built on import.
+    if name == "collator":
+        return get_collator() if pyuca else None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 _translation_state = Local()
@@ -90,6 +189,7 @@ class ComplexGameName(TypedDict):
     alpha3: str
     numeric: int
     ioc_code: str
+    bit: int
 
 
 GameName = Union["StrPromise", ComplexGameName]
@@ -113,6 +213,196 @@ class GameTuple(NamedTuple):
         return f"({self.code!r}, {self.name!r})"
 
 
+class NameIndex(NamedTuple):
+    """
+    Game names translated to a single language, used to resolve names back to
+    game codes.
+    """
+
+    names: Tuple[Tuple[str, str], ...]
+    folded_names: Tuple[Tuple[str, str], ...]
+    exact: Dict[str, str]
+    folded: Dict[str, str]
+    # ``(name, code)`` pairs sorted by name, for prefix searches.
+    exact_sorted: Tuple[Tuple[str, str], ...]
+    folded_sorted: Tuple[Tuple[str, str], ...]
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Return the set of trigrams for each word of some text, ignoring case and
+    punctuation.
+    """
+    grams: Set[str] = set()
+    for word in re.findall(r"\w+", text.casefold()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """
+    An inverted index from trigrams to names, used for fuzzy name matching.
+    """
+
+    def __init__(self, names: Iterable[Tuple[str, str]]):
+        # The code and trigram count of each name.
+        self.entries: List[Tuple[str, int]] = []
+        self.postings: Dict[str, List[int]] = {}
+        for code, name in names:
+            grams = trigrams(name)
+            entry = len(self.entries)
+            self.entries.append((code, len(grams)))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(entry)
+
+    def search(self, text: str) -> Tuple[str, float]:
+        """
+        Return the code of the most similar name and its similarity score.
+        """
+        grams = trigrams(text)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for entry in self.postings.get(gram, ()):
+                shared[entry] = shared.get(entry, 0) + 1
+        best_code, best_score = "", 0.0
+        # Earlier names win ties.
+        for entry in sorted(shared):
+            code, size = self.entries[entry]
+            count = shared[entry]
+            score = count / (len(grams) + size - count)
+            if score > best_score:
+                best_code, best_score = code, score
+        return best_code, best_score
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    A small thread-safe, least recently used cache.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+# The names of the options that ``Games.get_option`` snapshots.
+# Options that can be set per ``Games`` object, falling back to the matching
+# ``GAMES_*`` setting.
+OPTIONS = (
+    "only",
+    "override",
+    "common_names",
+    "first",
+    "first_repeat",
+    "first_break",
+    "first_sort",
+    "collation",
+)
+# Games objects with a snapshot of their options, to reset when settings change.
+_instances: "weakref.WeakSet[Games]" = weakref.WeakSet()
+
+_registry_versions = itertools.count(1)
+_missing = object()
+# Guards building (and resetting) registries and their indexes, so each is
+# only built once even when several threads ask for it at the same time.
+_build_lock = threading.RLock()
+
+
+class Registry:
+    """
+    A compiled snapshot of the games for a ``Games`` object, along with every
+    lookup index.
+
+    The games data is never changed once compiled (resetting the games cache
+    replaces the whole registry), so the indexes can't get out of step with
+    it. Indexes that depend on the language are built on first use.
+    """
+
+    def __init__(
+        self,
+        games: Dict[str, GameName],
+        shadowed_names: "Dict[str, List[StrPromise]]",
+        alt_codes: Dict[str, AltCodes],
+        ioc_codes: Dict[str, str],
+        bit_codes: Dict[str, int],
+        first: Iterable[GameCode],
+    ):
+        self.version = next(_registry_versions)
+        self.games = games
+        self.codes = frozenset(games)
+        self.shadowed_names = shadowed_names
+        self.alt_codes = alt_codes
+        self.ioc_codes = ioc_codes
+        self.bit_codes = bit_codes
+        self.bit_games = {bit: code for code, bit in bit_codes.items()}
+        # Reverse indexes used by ``alpha2``. The first code listed wins,
+        # matching the order a linear scan would find them in.
+        self.alpha3_codes: Dict[str, str] = {}
+        self.numeric_codes: Dict[int, str] = {}
+        for code, (alpha3, numeric) in alt_codes.items():
+            if alpha3:
+                self.alpha3_codes.setdefault(alpha3, code)
+            if numeric is not None:
+                self.numeric_codes.setdefault(numeric, code)
+        self.games_first = tuple(
+            code for code in (self.alpha2(item) for item in first) if code
+        )
+        # Indexes keyed by language.
+        self.name_indexes: Dict[str, NameIndex] = {}
+        self.trigram_indexes: Dict[str, TrigramIndex] = {}
+        self.sorted_choices: Dict[Tuple[Any, ...], Tuple[GameTuple, ...]] = {}
+        self.translated_names: Dict[Any, Dict[str, str]] = {}
+        # Shared ``Game`` objects, see ``Game.interned``.
+        self.game_objects: Dict[Tuple[Any, ...], Any] = {}
+
+    def alpha2(self, code: GameCode) -> str:
+        code_str = force_str(code).upper()
+        if code_str.isdigit():
+            code_str = self.numeric_codes.get(int(code_str), "")
+        elif len(code_str) == 3:
+            code_str = self.alpha3_codes.get(code_str, "")
+        if code_str in self.games:
+            return code_str
+        return ""
+
+
 class Games(GamesBase):
     """
     An object containing a list of ISO3166-1 games.
@@ -121,19 +411,178 @@ class Games(GamesBase):
     the game ``code`` and ``name``), sorted by name.
     """
 
-    _games: Dict[str, GameName]
-    _alt_codes: Dict[str, AltCodes]
+    _registry: Optional[Registry] = None
+    _options: Optional[Dict[str, Any]] = None
+    _regex_cache: LRUCache
+    # Maximum number of regex name searches to remember results for.
+    regex_cache_size = 256
+    # Minimum similarity for a fuzzy name match.
+    fuzzy_threshold = 0.5
 
     def get_option(self, option: str):
         """
         Get a configuration option, trying the options attribute first and
         falling back to a Django project setting.
+
+        Options are resolved once and then read from a snapshot, which is
+        reset along with the games cache (and whenever a ``GAMES_*`` setting is
+        changed with Django's ``setting_changed`` signal). Anything that isn't
+        one of the per-object ``OPTIONS`` is read straight from the settings.
         """
+        options = self._options
+        if options is None:
+            options = self._options = {
+                name: self._resolve_option(name) for name in OPTIONS
+            }
+            _instances.add(self)
+        try:
+            return options[option]
+        except KeyError:
+            return getattr(settings, f"GAMES_{option.upper()}")
+
+    def _resolve_option(self, option: str):
         value = getattr(self, option, None)
         if value is not None:
             return value
         return getattr(settings, f"GAMES_{option.upper()}")
 
+    @property
+    def registry(self) -> Registry:
+        """
+        Return the compiled registry of games, built from the options the
+        first time it is needed.
+        """
+        registry = self._registry
+        if registry is None:
+            with _build_lock:
+                registry = self._registry
+                if registry is None:
+                    registry = self._registry = self.compile()
+        return registry
+
+    def warm(self, languages: Optional[Iterable[str]] = None) -> None:
+        """
+        Build the registry, along with the name index and sorted choices for
+        each language, ahead of time.
+
+        :param languages: Defaults to the codes in ``settings.LANGUAGES``.
+        """
+        if languages is None:
+            languages = [code for code, name in settings.LANGUAGES]
+        for language in languages:
+            self.name_index(language)
+            with override(language):
+                self.sorted_choices()
+                self.translated_names()
+
+    def _registry_index(self, name: str, key: Any, build: Callable[[], Any]):
+        """
+        Return an index stored on the current registry, building it with
+        ``build`` if it doesn't exist yet.
+        """
+        index = getattr(self.registry, name).get(key)
+        if index is None:
+            with _build_lock:
+                # The registry may have been reset (or the index built by
+                # another thread) while waiting for the lock.
+                indexes = getattr(self.registry, name)
+                index = indexes.get(key)
+                if index is None:
+                    index = indexes[key] = build()
+        return index
+
+    def compile(self) -> Registry:
+        """
+        Build a new registry of games, modified by any overriding options.
+        """
+        only: "Iterable[Union[str, Tuple[str, StrPromise]]]" = self.get_option(
+            "only"
+        )
+        only_choices = True
+        if only:
+            # Originally used ``only`` as a dict, still supported.
+            if not isinstance(only, dict):
+                for item in only:
+                    if isinstance(item, str):
+                        only_choices = False
+                        break
+        shadowed_names: "Dict[str, List[StrPromise]]" = {}
+        games: Dict[str, GameName]
+        if only and only_choices:
+            games = dict(only)  # type: ignore
+        else:
+            # Local import so that games aren't loaded into memory
+            # until first used.
+            from django_games.data import GAMES
+
+            if only:
+                games = {}
+                for item in only:
+                    if isinstance(item, str):
+                        games[item] = GAMES[item]
+                    else:
+                        key, value = item
+                        games[key] = value
+            else:
+                games = dict(GAMES)
+            if self.get_option("common_names"):
+                for code, name in self.COMMON_NAMES.items():
+                    if code in games:
+                        games[code] = name
+            override: Dict[str, Union[GameName, None]] = self.get_option(
+                "override"
+            )
+            if override:
+                _games = cast(Dict[str, Union[GameName, None]], games)
+                _games.update(override)
+                games = {
+                    code: name for code, name in _games.items() if name is not None
+                }
+
+            if self.get_option("common_names"):
+                for code in self.COMMON_NAMES:
+                    if code in games and code not in override:
+                        shadowed_names[code] = [GAMES[code]]
+            for code, names in self.OLD_NAMES.items():
+                if code in games and code not in override:
+                    game_shadowed = shadowed_names.setdefault(code, [])
+                    game_shadowed.extend(names)
+
+        # Again, local import so data is not loaded unless it's needed.
+        from django_games.data import ALT_CODES, BIT_CODES
+        from django_games.ioc_data import ISO_TO_IOC
+
+        alt_codes: Dict[str, AltCodes] = ALT_CODES  # type: ignore
+        ioc_codes = ISO_TO_IOC
+        bit_codes = {code: bit for code, bit in BIT_CODES.items() if code in games}
+        for code, game in games.items():
+            if not isinstance(game, dict):
+                continue
+            if "bit" in game:
+                bit_codes[code] = game["bit"]
+            if "alpha3" in game or "numeric" in game:
+                if alt_codes is ALT_CODES:
+                    alt_codes = alt_codes.copy()
+                alpha3, numeric = alt_codes.get(code, ("", None))
+                if "alpha3" in game:
+                    alpha3 = game["alpha3"]
+                if "numeric" in game:
+                    numeric = game["numeric"]
+                alt_codes[code] = AltCodes(alpha3, numeric)
+            if "ioc_code" in game:
+                if ioc_codes is ISO_TO_IOC:
+                    ioc_codes = ioc_codes.copy()
+                ioc_codes[code] = game["ioc_code"]
+
+        return Registry(
+            games=games,
+            shadowed_names=shadowed_names,
+            alt_codes=alt_codes,
+            ioc_codes=ioc_codes,
+            bit_codes=bit_codes,
+            first=self.get_option("first") or [],
+        )
+
     @property
     def games(self) -> Dict[str, GameName]:
         """
@@ -142,71 +591,7 @@ class Games(GamesBase):
 
         The result is cached so future lookups are less work intensive.
         """
-        if not hasattr(self, "_games"):
-            only: "Iterable[Union[str, Tuple[str, StrPromise]]]" = self.get_option(
-                "only"
-            )
-            only_choices = True
-            if only:
-                # Originally used ``only`` as a dict, still supported.
-                if not isinstance(only, dict):
-                    for item in only:
-                        if isinstance(item, str):
-                            only_choices = False
-                            break
-            self._shadowed_names: "Dict[str, List[StrPromise]]" = {}
-            if only and only_choices:
-                self._games = dict(only)  # type: ignore
-            else:
-                # Local import so that games aren't loaded into memory
-                # until first used.
-                from django_games.data import GAMES
-
-                games_dict = dict(GAMES)
-                if only:
-                    self._games = {}
-                    for item in only:
-                        if isinstance(item, str):
-                            self._games[item] = games_dict[item]
-                        else:
-                            key, value = item
-                            self._games[key] = value
-                else:
-                    self._games = games_dict.copy()  # type: ignore
-                if self.get_option("common_names"):
-                    for code, name in self.COMMON_NAMES.items():
-                        if code in self._games:
-                            self._games[code] = name
-                override: Dict[str, Union[GameName, None]] = self.get_option(
-                    "override"
-                )
-                if override:
-                    _games = cast(
-                        Dict[str, Union[GameName, None]], self._games.copy()
-                    )
-                    _games.update(override)
-                    self._games = {
-                        code: name
-                        for code, name in _games.items()
-                        if name is not None
-                    }
-
-                if self.get_option("common_names"):
-                    for code in self.COMMON_NAMES:
-                        if code in self._games and code not in override:
-                            self._shadowed_names[code] = [games_dict[code]]
-                for code, names in self.OLD_NAMES.items():
-                    if code in self._games and code not in override:
-                        game_shadowed = self._shadowed_names.setdefault(code, [])
-                        game_shadowed.extend(names)
-
-            self.games_first = []
-            first: List[str] = self.get_option("first") or []
-            for code in first:
-                code = self.alpha2(code)
-                if code in self._games:
-                    self.games_first.append(code)
-        return self._games
+        return self.registry.games
 
     @games.deleter
     def games(self):
@@ -215,59 +600,96 @@ class Games(GamesBase):
         internal options change. But surely no one is crazy enough to do that,
         right?
         """
-        if hasattr(self, "_games"):
-            del self._games
-        if hasattr(self, "_alt_codes"):
-            del self._alt_codes
-        if hasattr(self, "_ioc_codes"):
-            del self._ioc_codes
-        if hasattr(self, "_shadowed_names"):
-            del self._shadowed_names
+        with _build_lock:
+            self._registry = None
+            self._options = None
+            if hasattr(self, "_regex_cache"):
+                self._regex_cache.clear()
+
+    @property
+    def version(self) -> int:
+        """
+        A number identifying the current registry, which changes every time the
+        games cache is reset.
+        """
+        return self.registry.version
+
+    @property
+    def codes(self) -> FrozenSet[str]:
+        """
+        Return the set of valid game codes.
+        """
+        return self.registry.codes
+
+    @property
+    def games_first(self) -> Tuple[str, ...]:
+        return self.registry.games_first
 
     @property
     def alt_codes(self) -> Dict[str, AltCodes]:
-        if not hasattr(self, "_alt_codes"):
-            # Again, local import so data is not loaded unless it's needed.
-            from django_games.data import ALT_CODES
-
-            self._alt_codes = ALT_CODES  # type: ignore
-            altered = False
-            for code, game in self.games.items():
-                if isinstance(game, dict) and (
-                    "alpha3" in game or "numeric" in game
-                ):
-                    if not altered:
-                        self._alt_codes = self._alt_codes.copy()
-                        altered = True
-                    alpha3, numeric = self._alt_codes.get(code, ("", None))
-                    if "alpha3" in game:
-                        alpha3 = game["alpha3"]
-                    if "numeric" in game:
-                        numeric = game["numeric"]
-                    self._alt_codes[code] = AltCodes(alpha3, numeric)
-        return self._alt_codes
+        return self.registry.alt_codes
+
+    @property
+    def alpha3_codes(self) -> Dict[str, str]:
+        """
+        Return a dictionary mapping three letter codes to game codes.
+        """
+        return self.registry.alpha3_codes
+
+    @property
+    def numeric_codes(self) -> Dict[int, str]:
+        """
+        Return a dictionary mapping numeric codes to game codes.
+        """
+        return self.registry.numeric_codes
 
     @property
     def ioc_codes(self) -> Dict[str, str]:
-        if not hasattr(self, "_ioc_codes"):
-            from django_games.ioc_data import ISO_TO_IOC
-
-            self._ioc_codes = ISO_TO_IOC
-            altered = False
-            for code, game in self.games.items():
-                if isinstance(game, dict) and "ioc_code" in game:
-                    if not altered:
-                        self._ioc_codes = self._ioc_codes.copy()
-                        altered = True
-                    self._ioc_codes[code] = game["ioc_code"]
-        return self._ioc_codes
+        return self.registry.ioc_codes
+
+    @property
+    def shadowed_names(self) -> "Dict[str, List[StrPromise]]":
+        return self.registry.shadowed_names
 
     @property
-    def shadowed_names(self):
-        if not getattr(self, "_shadowed_names", False):
-            # Getting games populates shadowed names.
-            self.games
-        return self._shadowed_names
+    def bit_codes(self) -> Dict[str, int]:
+        """
+        Return a dictionary mapping game codes to the bit used for them in
+        bitmasks.
+        """
+        return self.registry.bit_codes
+
+    def bitmask(self, codes: Iterable[GameCode]) -> int:
+        """
+        Return the bitmask with the bit of each of the games set.
+
+        Raises ``ValueError`` if a game has no bit.
+        """
+        registry = self.registry
+        mask = 0
+        for code in codes:
+            bit = registry.bit_codes.get(registry.alpha2(code))
+            if bit is None:
+                raise ValueError(f"Game {code!r} has no bitmask bit.")
+            mask |= 1 << bit
+        return mask
+
+    def bitmask_codes(self, mask: int) -> List[str]:
+        """
+        Return the codes of the games with a bit set in the bitmask, in bit
+        order. Unknown bits are ignored.
+        """
+        bit_games = self.registry.bit_games
+        # Read a negative (signed 64-bit) mask as unsigned.
+        mask &= (1 << 64) - 1
+        codes = []
+        while mask:
+            lowest = mask & -mask
+            code = bit_games.get(lowest.bit_length() - 1)
+            if code:
+                codes.append(code)
+            mask ^= lowest
+        return codes
 
     def translate_code(self, code: str, ignore_first: Optional[List[str]] = None):
         """
@@ -338,27 +760,65 @@ class Games(GamesBase):
         The first games can be separated from the sorted list by the
         value provided in ``settings.GAMES_FIRST_BREAK``.
         """
-        # Initializes games_first, so needs to happen first.
-        games = self.games
+        return iter(self.sorted_choices())
+
+    def sorted_choices(self) -> Tuple[GameTuple, ...]:
+        """
+        Return the sorted games (as yielded by iterating this object) for the
+        thread's current translation.
+
+        The result is cached per language and per ordering options, so only the
+        first iteration in each language pays for translating and sorting.
+        """
+        first_sort = self.get_option("first_sort")
+        first_break = self.get_option("first_break")
+        first_repeat = self.get_option("first_repeat")
+        key = (
+            get_language(),
+            bool(first_sort),
+            first_break,
+            bool(first_repeat),
+            self.get_option("collation"),
+        )
+        return self._registry_index(
+            "sorted_choices",
+            key,
+            lambda: tuple(self._build_choices(first_sort, first_break, first_repeat)),
+        )
+
+    def get_sort_key(self) -> Callable[[Tuple[str, str]], Any]:
+        """
+        Return the function used to sort ``(code, name)`` pairs by name, based
+        on the ``collation`` option.
+        """
+        collation = self.get_option("collation")
+        if collation is None:
+            return sort_key
+
+        def collation_sort_key(item: Tuple[str, str]) -> Any:
+            return collation_key(item[1], collation)
+
+        return collation_sort_key
+
+    def _build_choices(self, first_sort, first_break, first_repeat):
+        sort_key = self.get_sort_key()
 
         # Yield games that should be displayed first.
         games_first = (self.translate_pair(code) for code in self.games_first)
 
-        if self.get_option("first_sort"):
+        if first_sort:
             games_first = sorted(games_first, key=sort_key)
 
         yield from games_first
 
-        if self.games_first:
-            first_break = self.get_option("first_break")
-            if first_break:
-                yield GameTuple("", force_str(first_break))
+        if self.games_first and first_break:
+            yield GameTuple("", force_str(first_break))
 
         # Force translation before sorting.
-        ignore_first = None if self.get_option("first_repeat") else self.games_first
+        ignore_first = None if first_repeat else self.games_first
         games = tuple(
             itertools.chain.from_iterable(
-                self.translate_code(code, ignore_first) for code in games
+                self.translate_code(code, ignore_first) for code in self.games
             )
         )
 
@@ -376,31 +836,7 @@ class Games(GamesBase):
 
         If no match is found, returns an empty string.
         """
-        find: Optional[Callable]
-        code_str = force_str(code).upper()
-        if code_str.isdigit():
-            lookup_numeric = int(code_str)
-
-            def find(alt_codes):
-                return alt_codes[1] == lookup_numeric
-
-        elif len(code_str) == 3:
-            lookup_alpha3 = code_str
-
-            def find(alt_codes) -> bool:
-                return alt_codes[0] == lookup_alpha3
-
-        else:
-            find = None
-        if find:
-            code_str = ""
-            for alpha2, alt_codes in self.alt_codes.items():
-                if find(alt_codes):
-                    code_str = alpha2
-                    break
-        if code_str in self.games:
-            return code_str
-        return ""
+        return self.registry.alpha2(code)
 
     def name(self, code: GameCode) -> str:
         """
@@ -411,7 +847,66 @@ class Games(GamesBase):
         alpha2 = self.alpha2(code)
         if alpha2 not in self.games:
             return ""
-        return self.translate_pair(alpha2)[1]
+        return self.translated_names()[alpha2]
+
+    def translated_names(self) -> Dict[str, str]:
+        """
+        Return a dictionary mapping game codes to their names in the thread's
+        current translation.
+
+        The result is cached per language.
+        """
+        return self._registry_index(
+            "translated_names",
+            get_language(),
+            lambda: {code: self.translate_pair(code)[1] for code in self.games},
+        )
+
+    def alpha2_many(self, codes: Iterable[Any]) -> List[str]:
+        """
+        Return the normalized game codes for an iterable of codes (of any type
+        accepted by ``alpha2``, or ``Game`` objects).
+
+        Each distinct code is only resolved once.
+        """
+        return self._resolve_many(self.alpha2, codes)
+
+    def name_many(self, codes: Iterable[Any]) -> List[str]:
+        """
+        Return the names of the games for an iterable of codes.
+
+        Each distinct code is only resolved once.
+        """
+        return self._resolve_many(self.name, codes)
+
+    def numeric_many(
+        self, codes: Iterable[Any], padded: bool = False
+    ) -> List[Union[int, str, None]]:
+        """
+        Return the numeric game codes for an iterable of codes.
+
+        Each distinct code is only resolved once.
+        """
+        return self._resolve_many(
+            lambda code: self.numeric(code, padded=padded), codes  # type: ignore
+        )
+
+    def _resolve_many(self, resolve: Callable[[Any], Any], codes: Iterable[Any]):
+        resolved: Dict[Any, Any] = {}
+        results = []
+        for code in codes:
+            # Game objects resolve from their code, not their string value.
+            code = getattr(code, "code", code)
+            try:
+                result = resolved.get(code, _missing)
+            except TypeError:
+                # Unhashable, so just resolve it directly.
+                results.append(resolve(code))
+                continue
+            if result is _missing:
+                result = resolved[code] = resolve(code)
+            results.append(result)
+        return results
 
     @overload
     def by_name(
@@ -421,6 +916,7 @@ class Games(GamesBase):
         regex: Literal[False] = False,
         language: str = "en",
         insensitive: bool = True,
+        fuzzy: bool = False,
     ) -> str:
         ...
 
@@ -442,6 +938,7 @@ class Games(GamesBase):
         regex: bool = False,
         language: str = "en",
         insensitive: bool = True,
+        fuzzy: bool = False,
     ) -> Union[str, Set[str]]:
         """
         Fetch a game's ISO3166-1 two letter game code from its name.
@@ -458,15 +955,85 @@ class Games(GamesBase):
         If ``insensitive`` is set to False (True by default), then the search
         will be case sensitive.
 
+        If ``fuzzy`` is set to True and no name matches exactly, the closest
+        name is used instead (see ``by_name_fuzzy``) if it is similar enough.
+
         ..warning:: Be cautious about relying on this returning a game code
             (especially with any hard-coded string) since the ISO names of
             games may change over time.
         """
-        code_list = set()
         if regex:
-            re_match = re.compile(game, insensitive and re.IGNORECASE)
-        elif insensitive:
-            game = game.lower()
+            key = (game, insensitive, language, self.version)
+            codes = self.regex_cache.get(key)
+            if codes is None:
+                re_match = re.compile(game, insensitive and re.IGNORECASE)
+                codes = frozenset(
+                    code
+                    for code, name in self.name_index(language).names
+                    if re_match.search(name)
+                )
+                self.regex_cache.set(key, codes)
+            return set(codes)
+        index = self.name_index(language)
+        if insensitive:
+            code = index.folded.get(game.casefold(), "")
+        else:
+            code = index.exact.get(game, "")
+        if not code and fuzzy:
+            code, _ = self.by_name_fuzzy(game, language=language)
+        return code
+
+    def by_name_fuzzy(
+        self, game: str, *, language: str = "en", threshold: Optional[float] = None
+    ) -> Tuple[str, float]:
+        """
+        Fetch the game code with the name most similar to the given one.
+
+        Similarity is the proportion of shared trigrams (between 0 and 1),
+        ignoring case and punctuation. Current, alternate and shadowed names
+        are all considered.
+
+        :returns: a ``(code, score)`` tuple, or ``("", 0.0)`` if no name has a
+            score of at least ``threshold`` (defaults to ``fuzzy_threshold``).
+        """
+        if threshold is None:
+            threshold = self.fuzzy_threshold
+        trigram_index = self._registry_index(
+            "trigram_indexes",
+            language,
+            lambda: TrigramIndex(self.name_index(language).names),
+        )
+        code, score = trigram_index.search(game)
+        if not code or score < threshold:
+            return "", 0.0
+        return code, score
+
+    @property
+    def regex_cache(self) -> LRUCache:
+        """
+        The cache of ``by_name(regex=True)`` results. Use ``regex_cache.info()``
+        to get its hit and miss counts.
+        """
+        if not hasattr(self, "_regex_cache"):
+            with _build_lock:
+                if not hasattr(self, "_regex_cache"):
+                    self._regex_cache = LRUCache(self.regex_cache_size)
+        return self._regex_cache
+
+    def name_index(self, language: str) -> NameIndex:
+        """
+        Return the names of all games translated to the given language.
+
+        Current names, alternate names and shadowed names all map back to
+        their game code. The index is built on first use for each language and
+        is discarded along with the rest of the games cache.
+        """
+        return self._registry_index(
+            "name_indexes", language, lambda: self._build_name_index(language)
+        )
+
+    def _build_name_index(self, language: str) -> NameIndex:
+        names: List[Tuple[str, str]] = []
         with override(language):
             for code, check_game in self.games.items():
                 if isinstance(check_game, dict):
@@ -476,30 +1043,63 @@ class Games(GamesBase):
                         check_names = [check_game["name"]]
                 else:
                     check_names = [check_game]
-                for name in check_names:
-                    if regex:
-                        if re_match.search(str(name)):
-                            code_list.add(code)
-                    else:
-                        if insensitive:
-                            if game == name.lower():
-                                return code
-                        else:
-                            if game == name:
-                                return code
-                if code in self.shadowed_names:
-                    for shadowed_name in self.shadowed_names[code]:
-                        if regex:
-                            if re_match.search(str(shadowed_name)):
-                                code_list.add(code)
-                        else:
-                            if insensitive:
-                                shadowed_name = shadowed_name.lower()
-                            if game == shadowed_name:
-                                return code
-        if regex:
-            return code_list
-        return ""
+                check_names = check_names + self.shadowed_names.get(code, [])
+                names.extend((code, force_str(name)) for name in check_names)
+        folded_names: List[Tuple[str, str]] = []
+        exact: Dict[str, str] = {}
+        folded: Dict[str, str] = {}
+        for code, name in names:
+            folded_name = name.casefold()
+            folded_names.append((code, folded_name))
+            # The first game to use a name wins.
+            exact.setdefault(name, code)
+            folded.setdefault(folded_name, code)
+        return NameIndex(
+            names=tuple(names),
+            folded_names=tuple(folded_names),
+            exact=exact,
+            folded=folded,
+            exact_sorted=tuple(sorted((name, code) for code, name in names)),
+            folded_sorted=tuple(
+                sorted((name, code) for code, name in folded_names)
+            ),
+        )
+
+    def by_name_match(
+        self,
+        text: str,
+        *,
+        match: Literal["contains", "startswith", "endswith"] = "contains",
+        language: str = "en",
+        insensitive: bool = True,
+    ) -> Set[str]:
+        """
+        Fetch the set of game codes with a name containing, starting with or
+        ending with the given text.
+
+        This is a faster alternative to ``by_name(regex=True)`` for plain text
+        searches: prefix searches are a binary search over the sorted names.
+        """
+        index = self.name_index(language)
+        if insensitive:
+            text = text.casefold()
+        if match == "startswith":
+            sorted_names = index.folded_sorted if insensitive else index.exact_sorted
+            codes = set()
+            for position in range(
+                bisect.bisect_left(sorted_names, (text,)), len(sorted_names)
+            ):
+                name, code = sorted_names[position]
+                if not name.startswith(text):
+                    break
+                codes.add(code)
+            return codes
+        names = index.folded_names if insensitive else index.names
+        if match == "endswith":
+            return {code for code, name in names if name.endswith(text)}
+        if match == "contains":
+            return {code for code, name in names if text in name}
+        raise ValueError(f"Unknown name match type: {match!r}")
 
     def alpha3(self, code: GameCode) -> str:
         """
@@ -582,15 +1182,14 @@ class Games(GamesBase):
     def __getitem__(self, index):
         """
         Support:
-        - games[0]  → first game (existing behavior)
+        - games[0], games[1:5]  → games by position (existing behavior)
         - games["WOW"] → return WOW pair
         """
-        # ✅ Case 1: numeric index (old behavior)
+        # ✅ Case 1: numeric index or slice (old behavior)
         if isinstance(index, int):
-            try:
-                return next(itertools.islice(self.__iter__(), index, index + 1))
-            except TypeError:
-                return list(itertools.islice(self.__iter__(), index.start, index.stop, index.step))
+            return self.sorted_choices()[index]
+        if isinstance(index, slice):
+            return list(self.sorted_choices()[index])
 
         # ✅ Case 2: string index → game code
         if isinstance(index, str):
@@ -605,3 +1204,17 @@ class Games(GamesBase):
 
 
 games = Games()
+
+
+def _setting_changed(*, setting: str, **kwargs: Any) -> None:
+    global _collator
+    if not setting.startswith("GAMES_"):
+        return
+    if setting == "GAMES_COLLATION_TABLE":
+        _collator = None
+        collation_key.cache_clear()
+    for instance in list(_instances):
+        del instance.games
+
+
+setting_changed.connect(_setting_changed)
@@ -0,0 +1,53 @@
+import gc
+from typing import Iterable, List, Optional
+
+from django.apps import AppConfig, apps
+
+from django_games import Games, games
+from django_games.conf import settings
+
+
+def get_games_instances() -> List[Games]:
+    """
+    Return the default games object along with the games object of every
+    installed model's GameField.
+    """
+    from django_games.fields import GameField
+
+    instances: List[Games] = [games]
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, GameField) and not any(
+                field.games is instance for instance in instances
+            ):
+                instances.append(field.games)
+    return instances
+
+
+def warm_games(
+    languages: Optional[Iterable[str]] = None, gc_freeze: bool = False
+) -> List[Games]:
+    """
+    Build the registries and indexes of every games object up front, for
+    example in a pre-fork server's master process.
+
+    If ``gc_freeze`` is True, ``gc.freeze()`` is called afterwards so forked
+    workers can share the memory pages copy-on-write.
+    """
+    if languages is not None:
+        languages = list(languages)
+    instances = get_games_instances()
+    for instance in instances:
+        instance.warm(languages)
+    if gc_freeze:
+        gc.collect()
+        gc.freeze()
+    return instances
+
+
+class DjangoGamesConfig(AppConfig):
+    name = "django_games"
+
+    def ready(self):
+        if settings.GAMES_WARM:
+            warm_games(gc_freeze=settings.GAMES_WARM_GC_FREEZE)
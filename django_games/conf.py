@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import django.conf
 
@@ -22,6 +22,17 @@ class Settings(AppSettings):
     GAMES_FIRST_REPEAT = False
     GAMES_FIRST_BREAK = None
     GAMES_FIRST_SORT = False
+    # One of "uca", "ascii" or "unicode". Defaults to "uca" if pyuca is
+    # installed, otherwise "ascii".
+    GAMES_COLLATION: Optional[str] = None
+    # Path to the pyuca collation table to use instead of the full table.
+    GAMES_COLLATION_TABLE: Optional[str] = None
+    # Warn when a deferred GameField value is loaded for a single instance.
+    GAMES_DEFERRED_WARNING = False
+    # Build every games registry and index when Django starts.
+    GAMES_WARM = False
+    # Call gc.freeze() after warming, so forked workers share the memory.
+    GAMES_WARM_GC_FREEZE = False
 
 
 settings = Settings()
@@ -108,6 +108,48 @@ ALT_CODES = {
 }
 
 
+# =======================================================
+# BIT CODES — STABLE BIT PER GAME (GameField storage="bitmask")
+# Append only: never renumber or reuse a bit, stored masks depend on them.
+# Bits 0-62 fit in a signed 64-bit integer column.
+# =======================================================
+BIT_CODES = {
+    "WOW": 0,
+    "TWW": 1,
+    "MDN": 2,
+    "ERA": 3,
+    "HC": 4,
+    "SOD": 5,
+    "MOPC": 6,
+    "WOWP": 7,
+    "ANV": 8,
+    "TBCCA": 9,
+    "D2R": 10,
+    "D4": 11,
+    "AION": 12,
+    "AIC": 13,
+    "ALB": 14,
+    "BDO": 15,
+    "ESO": 16,
+    "EVE": 17,
+    "FFXIV": 18,
+    "GW2": 19,
+    "LARK": 20,
+    "LEP": 21,
+    "L2": 22,
+    "MO2": 23,
+    "NWA": 24,
+    "POE": 25,
+    "POE2": 26,
+    "RS3": 27,
+    "OSRS": 28,
+    "TRS": 29,
+    "TNL": 30,
+    "EFT": 31,
+    "ARC": 32,
+}
+
+
 # =======================================================
 # FILE GEN / DEBUG (unchanged)
 # =======================================================
@@ -1,86 +1,155 @@
+import functools
 import re
 import sys
-from typing import Any, Iterable, Optional, Tuple, Type, Union, cast
+import warnings
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type, Union, cast
 
 import django
 from django import forms
 from django.contrib.admin.filters import FieldListFilter
 from django.core import checks, exceptions
-from django.db.models import lookups
+from django.core.exceptions import EmptyResultSet, FullResultSet
+from django.dispatch import Signal
+from django.db import models
+from django.db.models import Value, lookups
 from django.db.models.fields import BLANK_CHOICE_DASH, CharField
+from django.db.models.functions import Concat
 from django.utils.encoding import force_str
 from django.utils.functional import lazy
+from django.utils.translation import get_language
 
 from django_games import Games, games, filters, widgets
 from django_games.conf import settings
 
-_entry_points: Iterable[Any]
-try:
-    import importlib.metadata
+# Sent when a deferred GameField value has to be loaded from the database
+# for a single instance (rather than for every object fetched with it).
+deferred_game_loaded = Signal()
 
-    if sys.version_info >= (3, 10):
-        _entry_points = importlib.metadata.entry_points(
-            group="django_games.Game"
-        )
-    else:
-        _entry_points = importlib.metadata.entry_points().get(
-            "django_games.Game", []
-        )
-except ImportError:  # Python <3.8
-    import pkg_resources
-
-    _entry_points = pkg_resources.iter_entry_points("django_games.Game")
 
-EXTENSIONS = {ep.name: ep.load() for ep in _entry_points}  # type: ignore
+@functools.lru_cache(maxsize=None)
+def get_extensions() -> Dict[str, Any]:
+    """
+    Return the ``django_games.Game`` entry point extensions.
 
+    Entry points are only discovered and loaded the first time an extension
+    attribute is looked up, rather than when this module is imported.
+    """
+    _entry_points: Iterable[Any]
+    try:
+        import importlib.metadata
 
-class TemporaryEscape:
-    __slots__ = ["game", "original_escape"]
+        if sys.version_info >= (3, 10):
+            _entry_points = importlib.metadata.entry_points(
+                group="django_games.Game"
+            )
+        else:
+            _entry_points = importlib.metadata.entry_points().get(
+                "django_games.Game", []
+            )
+    except ImportError:  # Python <3.8
+        import pkg_resources
 
-    def __init__(self, game):
-        self.game = game
+        _entry_points = pkg_resources.iter_entry_points("django_games.Game")
 
-    def __bool__(self):
-        return self.game._escape
+    return {ep.name: ep.load() for ep in _entry_points}  # type: ignore
 
-    def __enter__(self):
-        self.original_escape = self.game._escape
-        self.game._escape = True
 
-    def __exit__(self, type, value, traceback):
-        self.game._escape = self.original_escape
+def __getattr__(name: str) -> Any:
+    # Extensions used to be loaded into EXTENSIONS on import.
+    if name == "EXTENSIONS":
+        return get_extensions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Game:
     """
     Represents a game entry (formerly had icon properties — removed).
+
+    Use ``Game.interned()`` to get a shared instance rather than a new one.
     """
 
+    __slots__ = [
+        "_escape",
+        "_str_attr",
+        "custom_games",
+        "code",
+        "_cache",
+        "_cache_version",
+        "_key",
+    ]
+
     def __init__(
         self,
         code: str,
         str_attr: str = "code",
         custom_games: Optional[Games] = None,
     ):
-        self._escape = False
-        self._str_attr = str_attr
+        # Games are immutable (so they can be shared), see ``__setattr__``.
+        init = functools.partial(object.__setattr__, self)
+        init("_escape", False)
+        init("_str_attr", str_attr)
         if custom_games is games:
             custom_games = None
-        self.custom_games = custom_games
+        init("custom_games", custom_games)
         # Convert to normalized code if exists in registry
-        self.code = self.games.alpha2(code) or code
+        init("code", self.games.alpha2(code) or code)
+        # Equality and hashing are based on the code alone.
+        init("_key", force_str(self.code or ""))
+        init("_cache", {})
+        init("_cache_version", self.games.version)
+
+    @classmethod
+    def interned(
+        cls,
+        code: str,
+        str_attr: str = "code",
+        custom_games: Optional[Games] = None,
+    ) -> "Game":
+        """
+        Return a shared game object for the code.
+
+        Objects are shared per game code and ``str_attr`` for as long as the
+        games registry is in use, so they must not be modified. Codes that
+        aren't in the registry always get a new object.
+        """
+        registry = (custom_games or games).registry
+        alpha2 = registry.alpha2(code)
+        if not alpha2:
+            return cls(code, str_attr, custom_games)
+        key = (cls, alpha2, str_attr)
+        game = registry.game_objects.get(key)
+        if game is None:
+            game = registry.game_objects.setdefault(
+                key, cls(alpha2, str_attr, custom_games)
+            )
+        return game
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable.")
+
+    def __reduce__(self):
+        return (self.__class__, (self.code, self._str_attr, self.custom_games))
 
     def __str__(self):
         return force_str(getattr(self, self._str_attr) or "")
 
     def __eq__(self, other):
-        return force_str(self.code or "") == force_str(other or "")
+        if isinstance(other, Game):
+            return self._key == other._key
+        if isinstance(other, str):
+            return self._key == other
+        return self._key == force_str(other or "")
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(force_str(self))
+        # Strings cache their own hash (which differs between processes).
+        return hash(self._key)
 
     def __repr__(self):
         args = [f"code={self.code!r}"]
@@ -99,38 +168,84 @@ class Game:
         return self.custom_games or games
 
     @property
-    def escape(self):
-        return TemporaryEscape(self)
+    def escape(self) -> "Game":
+        """
+        Return an escaped copy of the game (this game is left unchanged).
+        """
+        game = self.__class__(self.code, self._str_attr, self.custom_games)
+        object.__setattr__(game, "_escape", True)
+        return game
 
     def maybe_escape(self, text) -> str:
         return text  # Escape removed (icons removed)
 
+    def _cached(self, key: Any, resolve: Callable[[], Any]) -> Any:
+        """
+        Return a value resolved from the games registry, caching it until the
+        registry is reset.
+        """
+        version = self.games.version
+        if self._cache_version != version:
+            object.__setattr__(self, "_cache", {})
+            object.__setattr__(self, "_cache_version", version)
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = resolve()
+            return value
+
     @property
     def name(self) -> str:
-        return self.maybe_escape(self.games.name(self.code))
+        return self.maybe_escape(
+            self._cached(
+                ("name", get_language()), lambda: self.games.name(self.code)
+            )
+        )
 
     @property
     def alpha3(self) -> str:
-        return self.games.alpha3(self.code)
+        return self._cached("alpha3", lambda: self.games.alpha3(self.code))
 
     @property
     def numeric(self) -> Optional[int]:
-        return self.games.numeric(self.code)
+        return self._cached("numeric", lambda: self.games.numeric(self.code))
 
     @property
     def numeric_padded(self) -> Optional[str]:
-        return self.games.numeric(self.code, padded=True)
+        return self._cached(
+            "numeric_padded", lambda: self.games.numeric(self.code, padded=True)
+        )
 
     @property
     def ioc_code(self):
-        return self.games.ioc_code(self.code)
+        return self._cached("ioc_code", lambda: self.games.ioc_code(self.code))
 
     def __getattr__(self, attr):
-        if attr in EXTENSIONS:
-            return EXTENSIONS[attr](self)
+        extensions = get_extensions()
+        if attr in extensions:
+            return extensions[attr](self)
         raise AttributeError()
 
 
+class CachedGames:
+    """
+    The game objects for the value of a multiple field, cached on a model
+    instance.
+
+    They're left out when the instance is pickled, since they belong to this
+    process's games registry.
+    """
+
+    __slots__ = ["value", "games"]
+
+    def __init__(self, value: Any = None, games: Iterable["Game"] = ()):
+        self.value = value
+        self.games = list(games)
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
 class GameDescriptor:
     """
     Descriptor for GameField. (icon removed)
@@ -144,14 +259,64 @@ class GameDescriptor:
             return self
         # Handle deferred fields
         if self.field.name not in instance.__dict__:
-            instance.refresh_from_db(fields=[self.field.name])
+            self.load_deferred(instance)
         value = instance.__dict__[self.field.name]
         if self.field.multiple:
-            return [self.game(code) for code in value]
+            # Cache the game objects until a new value is set.
+            cache_name = f"_{self.field.name}_games"
+            cached = instance.__dict__.get(cache_name)
+            if cached is None or cached.value is not value:
+                codes = self.field.games.alpha2_many(value)
+                cached = instance.__dict__[cache_name] = CachedGames(
+                    value,
+                    [
+                        self.game(code or raw)
+                        for code, raw in zip(codes, value, strict=True)
+                    ],
+                )
+            return list(cached.games)
         return self.game(value)
 
+    def load_deferred(self, instance):
+        """
+        Load the deferred field value from the database.
+
+        If the instance was fetched by a ``GameQuerySet``, the value is loaded
+        for all the objects fetched along with it in one query.
+        """
+        name = self.field.name
+        peers = getattr(instance._state, "games_peers", None)
+        if peers:
+            missing = {
+                peer.pk: peer
+                for peer in peers
+                if name not in peer.__dict__ and peer.pk is not None
+            }
+            values = (
+                type(instance)
+                ._base_manager.db_manager(instance._state.db)
+                .filter(pk__in=list(missing))
+                .values_list("pk", name)
+            )
+            for pk, value in values:
+                setattr(missing[pk], name, value)
+            if name in instance.__dict__:
+                return
+        deferred_game_loaded.send(
+            sender=type(instance), instance=instance, field=self.field
+        )
+        if settings.GAMES_DEFERRED_WARNING:
+            warnings.warn(
+                f"Loading deferred field {instance._meta.label}.{name} for a "
+                "single instance. Fetch it with the queryset, or use "
+                "GameQuerySet to load it for every fetched object at once.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        instance.refresh_from_db(fields=[name])
+
     def game(self, code):
-        return Game(
+        return Game.interned(
             code=code,
             str_attr=self.field.games_str_attr,
             custom_games=self.field.games,
@@ -162,13 +327,84 @@ class GameDescriptor:
         instance.__dict__[self.field.name] = value
 
 
+class GamePeers:
+    """
+    The objects fetched together by a ``GameQuerySet``.
+
+    They're held weakly, so one surviving object doesn't keep the rest alive,
+    and they're left out when an object is pickled.
+    """
+
+    def __init__(self, objects: Iterable[models.Model] = ()):
+        self.refs = [weakref.ref(obj) for obj in objects]
+
+    def __iter__(self):
+        for ref in self.refs:
+            obj = ref()
+            if obj is not None:
+                yield obj
+
+    def __bool__(self):
+        return bool(self.refs)
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
+class GameQuerySet(models.QuerySet):
+    """
+    A queryset that lets the objects it fetches load their deferred
+    ``GameField`` values together, in a single query, the first time one of
+    them is accessed.
+
+    Use it as a model's manager with ``objects = GameQuerySet.as_manager()``.
+    """
+
+    def _fetch_all(self):
+        first_fetch = self._result_cache is None
+        super()._fetch_all()
+        if not first_fetch:
+            return
+        deferred_names, defer = self.query.deferred_loading
+        if (
+            (deferred_names or not defer)
+            and issubclass(self._iterable_class, models.query.ModelIterable)
+            and len(self._result_cache) > 1
+        ):
+            peers = GamePeers(self._result_cache)
+            for obj in self._result_cache:
+                obj._state.games_peers = peers
+
+
 class LazyChoicesMixin(widgets.LazyChoicesMixin):
+    # While the choices are a ``Games`` object, values are checked against its
+    # set of codes rather than by walking every choice. Setting the choices
+    # again (say, to narrow them in a form) goes back to walking them.
+    games: Optional[Games] = None
+
+    def valid_value(self, value):
+        if self.games is not None:
+            return str(value) in self.games.codes
+        return super().valid_value(value)
+
     if django.VERSION < (5, 0):
 
         def _set_choices(self, value):
+            self.games = None
             super()._set_choices(value)
             self.widget.choices = value
 
+    else:
+
+        @property
+        def choices(self):
+            return forms.ChoiceField.choices.fget(self)
+
+        @choices.setter
+        def choices(self, value):
+            self.games = None
+            forms.ChoiceField.choices.fset(self, value)
+
 
 _Choice = Tuple[Any, str]
 _ChoiceNamedGroup = Tuple[str, Iterable[_Choice]]
@@ -187,6 +423,21 @@ class LazyTypedMultipleChoiceField(
     widget = widgets.LazySelectMultiple
 
 
+def _get_game_display(instance, field: "GameField"):
+    """
+    ``get_FOO_display()`` for game fields, looking the name up directly rather
+    than searching every choice.
+    """
+    value = getattr(instance, field.attname)
+    if not field.multiple:
+        code = getattr(value, "code", value)
+        if code:
+            name = field.games.name(code)
+            if name:
+                return name
+    return force_str(value, strings_only=True)
+
+
 class GameField(CharField):
     """
     Main model field for games.
@@ -195,6 +446,9 @@ class GameField(CharField):
 
     descriptor_class = GameDescriptor
     games: Games
+    # How many distinct stored values of a multiple field to cache the
+    # cleaned value of.
+    clean_cache_size = 1024
 
     def __init__(self, *args: Any, **kwargs: Any):
         games_class: Type[Games] = kwargs.pop("games", None)
@@ -204,6 +458,9 @@ class GameField(CharField):
         self.multiple = kwargs.pop("multiple", None)
         self.multiple_unique = kwargs.pop("multiple_unique", True)
         self.multiple_sort = kwargs.pop("multiple_sort", True)
+        self.storage = kwargs.pop("storage", "text")
+        self._clean_cache: Dict[Union[str, int], Tuple[str, ...]] = {}
+        self._clean_cache_version: Optional[int] = None
 
         # dynamic choices
         if django.VERSION >= (5, 0):
@@ -227,6 +484,51 @@ class GameField(CharField):
     def check(self, **kwargs):
         errors = super().check(**kwargs)
         errors.extend(self._check_multiple())
+        errors.extend(self._check_storage())
+        return errors
+
+    def _check_storage(self):
+        if self.storage == "text":
+            return []
+        if self.storage != "bitmask":
+            return [
+                checks.Error(
+                    f"Unknown storage {self.storage!r}.",
+                    obj=self,
+                    id="django_games.E101",
+                    hint='Use storage="text" or storage="bitmask".',
+                )
+            ]
+        if not self.multiple:
+            return [
+                checks.Error(
+                    'Field specifies storage="bitmask", so should be multiple.',
+                    obj=self,
+                    id="django_games.E102",
+                    hint="Add multiple=True argument on the field.",
+                )
+            ]
+        errors = []
+        bit_codes = self.games.bit_codes
+        missing = sorted(code for code in self.games.games if code not in bit_codes)
+        if missing:
+            errors.append(
+                checks.Error(
+                    f"Games {', '.join(missing)} have no bitmask bit.",
+                    obj=self,
+                    id="django_games.E103",
+                    hint='Add a "bit" to the overridden games.',
+                )
+            )
+        invalid = sorted(code for code, bit in bit_codes.items() if not 0 <= bit <= 62)
+        if invalid:
+            errors.append(
+                checks.Error(
+                    f"Games {', '.join(invalid)} have a bitmask bit outside 0-62.",
+                    obj=self,
+                    id="django_games.E104",
+                )
+            )
         return errors
 
     def _check_multiple(self):
@@ -246,11 +548,24 @@ class GameField(CharField):
         ]
 
     def get_internal_type(self):
+        if self.storage == "bitmask":
+            return "BigIntegerField"
         return "CharField"
 
     def contribute_to_class(self, cls, name):
+        display = f"get_{name}_display"
+        custom_display = display in cls.__dict__
         super().contribute_to_class(cls, name)
         setattr(cls, self.name, self.descriptor_class(self))
+        if not custom_display:
+            setattr(
+                cls, display, functools.partialmethod(_get_game_display, field=self)
+            )
+
+    @property
+    def flatchoices(self):
+        # The games choices are never nested, and are cached per language.
+        return self.games.sorted_choices()
 
     def pre_save(self, *args, **kwargs):
         value = super(CharField, self).pre_save(*args, **kwargs)
@@ -259,6 +574,8 @@ class GameField(CharField):
     def get_prep_value(self, value):
         value = self.get_clean_value(value)
         if self.multiple:
+            if self.storage == "bitmask":
+                return self.games.bitmask(value or ())
             value = ",".join(value) if value else ""
         return super(CharField, self).get_prep_value(value)
 
@@ -274,7 +591,44 @@ class GameField(CharField):
             return None
         if not self.multiple:
             return self.game_to_text(value)
-        if isinstance(value, (str, Game)):
+        if type(value) is tuple and self._is_clean(value):
+            return value
+        if isinstance(value, str) or type(value) is int:
+            # Values loaded from the database are usually repeated, so cache
+            # how they are cleaned. Bitmasks are decoded with the games
+            # registry, so the cache is dropped when the registry is reset.
+            version = self.games.version
+            if self._clean_cache_version != version:
+                self._clean_cache = {}
+                self._clean_cache_version = version
+            try:
+                return self._clean_cache[value]
+            except KeyError:
+                pass
+            if len(self._clean_cache) >= self.clean_cache_size:
+                self._clean_cache.clear()
+            cleaned = self._clean_cache[value] = self._clean_multiple(value)
+            return cleaned
+        return self._clean_multiple(value)
+
+    def _is_clean(self, value: Tuple[Any, ...]) -> bool:
+        """
+        Whether a tuple is already a cleaned value: sorted, unique, non-empty
+        codes.
+        """
+        if not (self.multiple_sort and self.multiple_unique):
+            return False
+        previous = ""
+        for code in value:
+            if type(code) is not str or code <= previous:
+                return False
+            previous = code
+        return True
+
+    def _clean_multiple(self, value) -> Tuple[str, ...]:
+        if type(value) is int and self.storage == "bitmask":
+            value = self.games.bitmask_codes(value)
+        elif isinstance(value, (str, Game)):
             if isinstance(value, str) and "," in value:
                 value = value.split(",")
             else:
@@ -297,14 +651,16 @@ class GameField(CharField):
             cleaned_value.append(c)
 
         if self.multiple_sort:
-            cleaned_value = sorted(cleaned_value)
-        return cleaned_value
+            cleaned_value.sort()
+        return tuple(cleaned_value)
 
     def deconstruct(self):
         name, path, args, kwargs = super(CharField, self).deconstruct()
         kwargs.pop("choices", None)
         if self.multiple:
             kwargs["multiple"] = self.multiple
+        if self.storage != "text":
+            kwargs["storage"] = self.storage
         if not self.multiple_unique:
             kwargs["multiple_unique"] = False
         if not self.multiple_sort:
@@ -360,11 +716,16 @@ class GameField(CharField):
         )
         if "coerce" not in kwargs:
             kwargs["coerce"] = super().to_python
-        return super().formfield(**kwargs)
+        form_field = super().formfield(**kwargs)
+        if "choices" not in kwargs and isinstance(form_field, LazyChoicesMixin):
+            form_field.games = self.games
+        return form_field
 
     def to_python(self, value):
         if not self.multiple:
             return super().to_python(value)
+        if type(value) is int and self.storage == "bitmask":
+            value = self.games.bitmask_codes(value)
         if not value:
             return value
         if isinstance(value, str):
@@ -382,9 +743,9 @@ class GameField(CharField):
             return
 
         if value:
-            choices = [option_key for option_key, option_value in self.choices]
+            codes = self.games.codes
             for single_value in value:
-                if single_value not in choices:
+                if single_value not in codes:
                     raise exceptions.ValidationError(
                         self.error_messages["invalid_choice"],
                         code="invalid_choice",
@@ -399,6 +760,13 @@ class GameField(CharField):
         return self.get_prep_value(value)
 
     def get_lookup(self, lookup_name):
+        if lookup_name in ("has", "has_any", "has_all") and self.storage != "bitmask":
+            return None
+        if lookup_name in DELIMITED_LOOKUPS:
+            if not self.multiple:
+                return None
+            if self.storage == "bitmask":
+                lookup_name = DELIMITED_LOOKUPS[lookup_name]
         if (
             not self.multiple
             and lookup_name
@@ -443,15 +811,23 @@ class FullNameLookup(lookups.In):
     expr: str
     insensitive: bool = False
     escape_regex: bool = True
+    # Plain text searches use the name index rather than a regex.
+    match: Optional[str] = None
 
     def get_prep_lookup(self):
         if isinstance(self.rhs, str):
-            value = self.expr.format(
-                text=re.escape(self.rhs) if self.escape_regex else self.rhs
-            )
-            options = cast(GameField, self.lhs.output_field).games.by_name(
-                value, regex=True, insensitive=self.insensitive
-            )
+            field_games = cast(GameField, self.lhs.output_field).games
+            if self.match:
+                options = field_games.by_name_match(
+                    self.rhs, match=self.match, insensitive=self.insensitive
+                )
+            else:
+                value = self.expr.format(
+                    text=re.escape(self.rhs) if self.escape_regex else self.rhs
+                )
+                options = field_games.by_name(
+                    value, regex=True, insensitive=self.insensitive
+                )
             if len(self.rhs) == 2 and (
                 self.rhs == self.rhs.upper() or self.insensitive
             ):
@@ -464,6 +840,7 @@ class FullNameLookup(lookups.In):
 class GameContains(FullNameLookup):
     lookup_name = "game_contains"
     expr = r"{text}"
+    match = "contains"
 
 
 @GameField.register_lookup
@@ -476,6 +853,7 @@ class GameIContains(GameContains):
 class GameStartswith(FullNameLookup):
     lookup_name = "game_startswith"
     expr = r"^{text}"
+    match = "startswith"
 
 
 @GameField.register_lookup
@@ -488,6 +866,7 @@ class GameIStartswith(GameStartswith):
 class GameEndswith(FullNameLookup):
     lookup_name = "game_endswith"
     expr = r"{text}$"
+    match = "endswith"
 
 
 @GameField.register_lookup
@@ -509,4 +888,122 @@ class GameIRegex(GameRegex):
     insensitive = True
 
 
+class BitmaskLookup(lookups.Lookup):
+    """
+    Base for lookups on the games stored in a ``storage="bitmask"`` field.
+    """
+
+    # SQL to compare the field's value (masked to the looked up bits) with.
+    comparison: str
+    # Raised when there are no games to look for.
+    empty_result: Type[Exception]
+    # Whether games without a bit are left out, rather than the lookup
+    # matching nothing.
+    skip_missing = False
+    prepare_rhs = False
+    # The prepared mask is None when the lookup can't match anything.
+    can_use_none_as_rhs = True
+
+    def get_prep_lookup(self):
+        field = cast(GameField, self.lhs.output_field)
+        games = field.games
+        codes = field.get_clean_value(self.rhs) or ()
+        known = [code for code in codes if games.alpha2(code) in games.bit_codes]
+        if len(known) < len(codes) and not self.skip_missing:
+            # No stored value can have a game without a bit.
+            return None
+        return games.bitmask(known)
+
+    def as_sql(self, compiler, connection):
+        if self.rhs is None:
+            raise EmptyResultSet
+        if not self.rhs:
+            raise self.empty_result
+        lhs_sql, params = self.process_lhs(compiler, connection)
+        masked = connection.ops.combine_expression("&", [lhs_sql, "%s"])
+        params = [*params, self.rhs]
+        if "%s" in self.comparison:
+            # Compared against the mask itself.
+            params.append(self.rhs)
+        return f"({masked}) {self.comparison}", params
+
+
+@GameField.register_lookup
+class HasAllGames(BitmaskLookup):
+    lookup_name = "has_all"
+    comparison = "= %s"
+    empty_result = FullResultSet
+
+
+@GameField.register_lookup
+class HasGame(HasAllGames):
+    lookup_name = "has"
+
+
+@GameField.register_lookup
+class HasAnyGame(BitmaskLookup):
+    lookup_name = "has_any"
+    comparison = "<> 0"
+    empty_result = EmptyResultSet
+    skip_missing = True
+
+
+class DelimitedGamesLookup(lookups.Lookup):
+    """
+    Base for lookups on the games stored in a comma separated multiple field,
+    matching whole codes only (so "EFT" doesn't match "EFT2").
+    """
+
+    # SQL joining the conditions for each looked up game.
+    connector: str
+    prepare_rhs = False
+
+    def get_prep_lookup(self):
+        field = cast(GameField, self.lhs.output_field)
+        return field.get_clean_value(self.rhs) or ()
+
+    def as_sql(self, compiler, connection):
+        if not self.rhs:
+            # No games to look for: "all" matches everything, "any" nothing.
+            raise FullResultSet if self.connector == " AND " else EmptyResultSet
+        # Wrap the value in delimiters so every code is surrounded by them.
+        wrapped = Concat(Value(","), self.lhs, Value(","), output_field=CharField())
+        lhs_sql, lhs_params = compiler.compile(
+            wrapped.resolve_expression(compiler.query)
+        )
+        condition = f"{lhs_sql} {connection.operators['contains']}"
+        sql = []
+        params = []
+        for code in self.rhs:
+            sql.append(condition)
+            params.extend(lhs_params)
+            params.append(f"%,{connection.ops.prep_for_like_query(code)},%")
+        return f"({self.connector.join(sql)})", params
+
+
+@GameField.register_lookup
+class ContainsAllGames(DelimitedGamesLookup):
+    lookup_name = "contains_all_games"
+    connector = " AND "
+
+
+@GameField.register_lookup
+class ContainsGame(ContainsAllGames):
+    lookup_name = "contains_game"
+
+
+@GameField.register_lookup
+class ContainsAnyGame(DelimitedGamesLookup):
+    lookup_name = "contains_any_game"
+    connector = " OR "
+
+
+# Delimited lookups and their equivalent lookups for bitmask storage.
+DELIMITED_LOOKUPS = {
+    "contains_game": "has",
+    "contains_any_game": "has_any",
+    "contains_all_games": "has_all",
+}
+
+
 FieldListFilter.register(lambda f: isinstance(f, GameField), filters.GameFilter)
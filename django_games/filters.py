@@ -1,5 +1,11 @@
+import hashlib
+from typing import Dict, List, Optional
+
 import django
 from django.contrib import admin
+from django.contrib.admin.views.main import IS_FACETS_VAR, ORDER_VAR, PAGE_VAR
+from django.core.cache import cache
+from django.db.models import Count
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
@@ -7,6 +13,11 @@ from django.utils.translation import gettext_lazy as _
 class GameFilter(admin.FieldListFilter):
 
     title = _("Game")  # type: ignore
+    # Seconds to cache the facet counts for, or ``None`` to not cache them.
+    # The cache key covers the other query parameters, the host and the user.
+    # If the model admin's queryset depends on anything else (the session, a
+    # tenant...), override ``facet_cache_key()`` to include it.
+    facet_cache_timeout: Optional[int] = None
 
     def expected_parameters(self):
         return [self.field.name]
@@ -16,6 +27,9 @@ class GameFilter(admin.FieldListFilter):
         # In Django 5.x, query parameters may come as lists
         if isinstance(value, list) and len(value) == 1:
             value = value[0]
+        counts = None
+        if changelist.add_facets:
+            counts = self.get_facet_queryset(changelist)
         yield {
             "selected": value is None,
             "query_string": changelist.get_query_string({}, [self.field.name]),
@@ -25,6 +39,8 @@ class GameFilter(admin.FieldListFilter):
             selected = force_str(lookup) == value
             if django.VERSION >= (5, 0):
                 selected = value is not None and selected
+            if counts is not None:
+                title = f"{title} ({counts.get(lookup, 0)})"
             yield {
                 "selected": selected,
                 "query_string": changelist.get_query_string(
@@ -35,11 +51,66 @@ class GameFilter(admin.FieldListFilter):
 
     def lookup_choices(self, changelist):
         qs = changelist.model._default_manager.all()
-        codes = set(
+        values = (
             qs.distinct()
             .order_by(self.field.name)
             .values_list(self.field.name, flat=True)
         )
-        for k, v in self.field.get_choices(include_blank=False):
+        codes = set()
+        for value in values:
+            codes.update(self.value_codes(value))
+        for k, v in self.field.flatchoices:
             if k in codes:
                 yield k, v
+
+    def value_codes(self, value) -> List[str]:
+        """
+        Return the game codes in a stored value of the field.
+        """
+        if self.field.multiple:
+            # Each stored combination counts towards every game in it.
+            return self.field.to_python(value) or []
+        return [value]
+
+    def get_facet_queryset(self, changelist) -> Dict[str, int]:
+        """
+        Return the number of objects for each game code, counted with a single
+        GROUP BY query over the changelist's otherwise filtered queryset.
+        """
+        timeout = self.facet_cache_timeout
+        if timeout is not None:
+            key = self.facet_cache_key(changelist)
+            counts = cache.get(key)
+            if counts is not None:
+                return counts
+        qs = changelist.get_queryset(
+            self.request, exclude_parameters=self.expected_parameters()
+        )
+        rows = (
+            qs.order_by()
+            .values(self.field.name)
+            .annotate(count=Count("pk"))
+            .values_list(self.field.name, "count")
+        )
+        counts: Dict[str, int] = {}
+        for value, count in rows:
+            for code in self.value_codes(value):
+                counts[code] = counts.get(code, 0) + count
+        if timeout is not None:
+            cache.set(key, counts, timeout)
+        return counts
+
+    def facet_cache_key(self, changelist) -> str:
+        ignored = {PAGE_VAR, ORDER_VAR, IS_FACETS_VAR, *self.expected_parameters()}
+        params = sorted(
+            (name, tuple(values))
+            for name, values in self.request.GET.lists()
+            if name not in ignored
+        )
+        user = getattr(self.request, "user", None)
+        state = repr((params, self.request.get_host(), getattr(user, "pk", None)))
+        digest = hashlib.md5(state.encode(), usedforsecurity=False).hexdigest()
+        return (
+            f"django_games.filters:{changelist.model._meta.label_lower}:"
+            f"{self.field.name}:{digest}"
+        )
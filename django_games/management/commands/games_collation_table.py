@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_games import pyuca, write_collation_table
+from django_games.apps import get_games_instances
+from django_games.conf import settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a pyuca collation table trimmed to the characters used in game "
+        "names, for use as the GAMES_COLLATION_TABLE setting."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("filename", help="Path to write the table to.")
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            help=(
+                "Language to include the game names of (can be repeated). "
+                "Defaults to every language in settings.LANGUAGES."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if pyuca is None:
+            raise CommandError("pyuca must be installed to write a collation table.")
+        languages = options["languages"] or [code for code, name in settings.LANGUAGES]
+        texts = []
+        for instance in get_games_instances():
+            for language in languages:
+                names = instance.name_index(language).names
+                texts.extend(name for code, name in names)
+        filename = options["filename"]
+        count = write_collation_table(filename, texts)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {count} collation entries to {filename}.")
+        )
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_games.apps import warm_games
+
+
+class Command(BaseCommand):
+    help = "Build every games registry and index ahead of time."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            help=(
+                "Language to build the indexes for (can be repeated). Defaults "
+                "to every language in settings.LANGUAGES."
+            ),
+        )
+        parser.add_argument(
+            "--gc-freeze",
+            action="store_true",
+            help="Call gc.freeze() once the indexes are built.",
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        instances = warm_games(
+            languages=options["languages"], gc_freeze=options["gc_freeze"]
+        )
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Warmed {len(instances)} games registries in {elapsed * 1000:.1f}ms."
+            )
+        )
@@ -1,7 +1,9 @@
 from typing import Any
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils.encoding import force_str
 from rest_framework import serializers
+from rest_framework.fields import get_error_detail
 
 from django_games import games
 
@@ -10,6 +12,7 @@ class GameField(serializers.ChoiceField):
     def __init__(self, *args, **kwargs):
         self.game_dict = kwargs.pop("game_dict", None)
         self.name_only = kwargs.pop("name_only", None)
+        self.fuzzy = kwargs.pop("fuzzy", None)
         field_games = kwargs.pop("games", None)
         self.games = field_games or games
         super().__init__(
@@ -20,13 +23,21 @@ class GameField(serializers.ChoiceField):
 
     def to_representation(self, obj):
         code = self.games.alpha2(obj)
+        if not code or not (self.name_only or self.game_dict):
+            return code
+        return self.represent(code, self.games.name(code))
+
+    def represent(self, code: str, name: str):
+        """
+        Return the representation of an already resolved game code and name.
+        """
         if not code:
             return ""
         if self.name_only:
-            return force_str(self.games.name(obj))
+            return force_str(name)
         if not self.game_dict:
             return code
-        return {"code": code, "name": force_str(self.games.name(obj))}
+        return {"code": code, "name": force_str(name)}
 
     def to_internal_value(self, data: Any):
         if not self.allow_blank and data == "":
@@ -36,7 +47,62 @@ class GameField(serializers.ChoiceField):
             data = data.get("code")
         game = self.games.alpha2(data)
         if data and not game:
-            game = self.games.by_name(force_str(data))
+            game = self.by_name(force_str(data))
             if not game:
                 self.fail("invalid_choice", input=data)
         return game
+
+    def by_name(self, name: str) -> str:
+        if not self.fuzzy:
+            return self.games.by_name(name)
+        game = self.games.by_name(name)
+        if not game:
+            # A number is used as the minimum similarity score.
+            threshold = None if self.fuzzy is True else self.fuzzy
+            game, _ = self.games.by_name_fuzzy(name, threshold=threshold)
+        return game
+
+
+class GameListField(serializers.ListField):
+    """
+    A list of games, resolving all the codes in one batch.
+    """
+
+    child: GameField
+
+    def to_representation(self, data):
+        data = list(data)
+        games = self.child.games
+        codes = games.alpha2_many(data)
+        if self.child.name_only or self.child.game_dict:
+            names = games.name_many(codes)
+        else:
+            names = codes
+        return [
+            None if item is None else self.child.represent(code, name)
+            for item, code, name in zip(data, codes, names, strict=True)
+        ]
+
+    def run_child_validation(self, data):
+        if self.child.validators:
+            return super().run_child_validation(data)
+        # Items that are already game codes are resolved in one batch, the
+        # child field only validates the rest (names, dicts, invalid values).
+        codes = self.child.games.alpha2_many(
+            item if isinstance(item, (str, int)) else None for item in data
+        )
+        result = []
+        errors = {}
+        for idx, (item, code) in enumerate(zip(data, codes, strict=True)):
+            if code:
+                result.append(code)
+                continue
+            try:
+                result.append(self.child.run_validation(item))
+            except serializers.ValidationError as e:
+                errors[idx] = e.detail
+            except DjangoValidationError as e:
+                errors[idx] = get_error_detail(e)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return result
@@ -23,7 +23,7 @@ class GameFieldMixin:
         if not model_field.multiple:
             field_class = serializer_fields.GameField
         else:
-            field_class = serializers.ListField
+            field_class = serializer_fields.GameListField
             child_field = serializer_fields.GameField(**field_kwargs)
             field_kwargs = {"child": child_field}
             if "max_length" in serializers.ListField.default_error_messages:
@@ -0,0 +1,58 @@
+"""
+Time rendering the game column of a 1,000 row admin changelist, and the
+matching ``get_FOO_display()`` calls.
+
+Run with:
+    DJANGO_SETTINGS_MODULE=django_games.tests.settings \
+        python -m django_games.tests.benchmark_changelist
+"""
+
+import timeit
+
+import django
+
+
+def main(rows: int = 1000, repeat: int = 5) -> None:
+    django.setup()
+
+    from django.contrib import admin
+    from django.contrib.admin.templatetags.admin_list import results
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.test import RequestFactory
+
+    from django_games import games
+    from django_games.tests.models import Item
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    codes = list(games.games)
+    Item.objects.bulk_create(
+        Item(name=str(i), game=codes[i % len(codes)]) for i in range(rows)
+    )
+
+    class ItemAdmin(admin.ModelAdmin):
+        list_display = ["name", "game"]
+        list_display_links = None
+        list_per_page = rows
+
+    request = RequestFactory().get("/")
+    request.user = User(is_active=True, is_staff=True, is_superuser=True)
+    changelist = ItemAdmin(Item, admin.site).get_changelist_instance(request)
+    changelist.formset = None
+    items = list(changelist.result_list)
+
+    def render():
+        for row in results(changelist):
+            list(row)
+
+    def display():
+        for item in items:
+            item.get_game_display()
+
+    for name, func in [("changelist rows", render), ("get_game_display", display)]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name}: {best * 1000:.1f}ms for {len(items)} rows")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
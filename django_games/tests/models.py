@@ -0,0 +1,15 @@
+from django.db import models
+
+from django_games.fields import GameField, GameQuerySet
+
+
+class Item(models.Model):
+    name = models.CharField(max_length=50, blank=True)
+    game = GameField(blank=True)
+    games = GameField(multiple=True, blank=True)
+
+    objects = GameQuerySet.as_manager()
+
+
+class BitmaskItem(models.Model):
+    games = GameField(multiple=True, blank=True, storage="bitmask")
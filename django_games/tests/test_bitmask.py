@@ -0,0 +1,127 @@
+from django.core.exceptions import FieldError
+from django.db import models
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import isolate_apps
+
+from django_games import Games
+from django_games.fields import GameField
+from django_games.tests.models import BitmaskItem, Item
+
+
+class TestBitmaskStorage(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.both = BitmaskItem.objects.create(games=["WOW", "ARC"])
+        cls.wow = BitmaskItem.objects.create(games=["WOW"])
+        cls.eft = BitmaskItem.objects.create(games=["EFT"])
+        cls.empty = BitmaskItem.objects.create(games=[])
+
+    def filter(self, **kwargs):
+        return set(BitmaskItem.objects.filter(**kwargs))
+
+    def exclude(self, **kwargs):
+        return set(BitmaskItem.objects.exclude(**kwargs))
+
+    def test_round_trip(self):
+        item = BitmaskItem.objects.get(pk=self.both.pk)
+        self.assertEqual(item.games, ["ARC", "WOW"])
+        self.assertEqual(BitmaskItem.objects.get(pk=self.empty.pk).games, [])
+
+    def test_stored_as_mask(self):
+        games = Games()
+        mask = BitmaskItem.objects.filter(pk=self.both.pk).values_list(
+            "games", flat=True
+        )[0]
+        self.assertEqual(mask, games.bitmask(["WOW", "ARC"]))
+
+    def test_to_python(self):
+        field = BitmaskItem._meta.get_field("games")
+        self.assertEqual(field.to_python(0), [])
+        self.assertEqual(field.to_python(Games().bitmask(["EFT"])), ["EFT"])
+
+    def test_has(self):
+        self.assertEqual(self.filter(games__has="WOW"), {self.both, self.wow})
+
+    def test_has_all(self):
+        self.assertEqual(self.filter(games__has_all=["WOW", "ARC"]), {self.both})
+
+    def test_has_any(self):
+        self.assertEqual(
+            self.filter(games__has_any=["ARC", "EFT"]), {self.both, self.eft}
+        )
+
+    def test_empty_list(self):
+        everything = {self.both, self.wow, self.eft, self.empty}
+        self.assertEqual(self.filter(games__has_all=[]), everything)
+        self.assertEqual(self.filter(games__has_any=[]), set())
+        self.assertEqual(self.exclude(games__has_any=[]), everything)
+
+    def test_unknown_code(self):
+        self.assertEqual(self.filter(games__has="XXX"), set())
+        self.assertEqual(self.filter(games__has_all=["WOW", "XXX"]), set())
+        self.assertEqual(
+            self.filter(games__has_any=["WOW", "XXX"]), {self.both, self.wow}
+        )
+        self.assertEqual(self.filter(games__has_any=["XXX"]), set())
+
+    def test_text_storage_lookups(self):
+        with self.assertRaises(FieldError):
+            Item.objects.filter(games__has="WOW")
+
+    def test_text_storage_int(self):
+        self.assertEqual(Item(games=5).games, ["5"])
+        self.assertEqual(Item._meta.get_field("games").get_prep_value(5), "5")
+
+
+class TestBitmaskChecks(SimpleTestCase):
+    def check_ids(self, field):
+        return [error.id for error in field.check()]
+
+    @isolate_apps("django_games.tests")
+    def test_valid(self):
+        class Model(models.Model):
+            games = GameField(multiple=True, storage="bitmask")
+
+        self.assertEqual(self.check_ids(Model._meta.get_field("games")), [])
+
+    @isolate_apps("django_games.tests")
+    def test_unknown_storage(self):
+        class Model(models.Model):
+            games = GameField(multiple=True, storage="json")
+
+        self.assertEqual(
+            self.check_ids(Model._meta.get_field("games")), ["django_games.E101"]
+        )
+
+    @isolate_apps("django_games.tests")
+    def test_not_multiple(self):
+        class Model(models.Model):
+            game = GameField(storage="bitmask")
+
+        self.assertEqual(
+            self.check_ids(Model._meta.get_field("game")), ["django_games.E102"]
+        )
+
+    @isolate_apps("django_games.tests")
+    def test_missing_bit(self):
+        class NewGames(Games):
+            override = {"NEW": "New Game"}
+
+        class Model(models.Model):
+            games = GameField(multiple=True, storage="bitmask", games=NewGames)
+
+        self.assertEqual(
+            self.check_ids(Model._meta.get_field("games")), ["django_games.E103"]
+        )
+
+    @isolate_apps("django_games.tests")
+    def test_bit_out_of_range(self):
+        class NewGames(Games):
+            override = {"NEW": {"name": "New Game", "bit": 63}}
+
+        class Model(models.Model):
+            games = GameField(multiple=True, storage="bitmask", games=NewGames)
+
+        self.assertEqual(
+            self.check_ids(Model._meta.get_field("games")), ["django_games.E104"]
+        )
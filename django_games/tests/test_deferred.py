@@ -0,0 +1,51 @@
+import gc
+import pickle
+
+from django.test import TestCase
+
+from django_games.fields import Game
+from django_games.tests.models import Item
+
+
+class TestDeferredLoading(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Item.objects.bulk_create(
+            [Item(game="WOW"), Item(game="EFT"), Item(game="POE")]
+            + [Item(name="x" * 50) for _ in range(20)]
+        )
+
+    def test_load_for_all_peers(self):
+        items = list(Item.objects.only("pk").order_by("pk"))
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                [item.game for item in items[:3]], ["WOW", "EFT", "POE"]
+            )
+        self.assertIsInstance(items[0].game, Game)
+
+    def test_peers_tagged_once(self):
+        qs = Item.objects.only("pk")
+        list(qs)
+        peers = qs[0]._state.games_peers
+        len(qs)
+        bool(qs)
+        list(qs)
+        self.assertIs(qs[0]._state.games_peers, peers)
+
+    def test_peers_held_weakly(self):
+        items = list(Item.objects.only("pk").order_by("pk"))
+        first = items[0]
+        del items
+        gc.collect()
+        self.assertEqual(list(first._state.games_peers), [first])
+        with self.assertNumQueries(1):
+            self.assertEqual(first.game, "WOW")
+
+    def test_pickle_leaves_out_peers(self):
+        item = list(Item.objects.only("pk").order_by("pk"))[0]
+        plain = Item.objects.only("pk").order_by("pk").first()
+        # Only an empty placeholder is pickled, not the other objects.
+        self.assertLess(len(pickle.dumps(item)), len(pickle.dumps(plain)) + 100)
+        loaded = pickle.loads(pickle.dumps(item))
+        self.assertFalse(loaded._state.games_peers)
+        self.assertEqual(loaded.game, "WOW")
@@ -0,0 +1,90 @@
+import pickle
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import translation
+
+from django_games import Games, games
+from django_games.fields import Game, GameField
+from django_games.tests.models import Item
+
+
+class TestMultipleCleanValue(SimpleTestCase):
+    def setUp(self):
+        self.field = Item._meta.get_field("games")
+
+    def test_tuple(self):
+        self.assertEqual(
+            self.field.get_clean_value(["WOW", "EFT", "WOW", ""]), ("EFT", "WOW")
+        )
+        self.assertEqual(self.field.get_clean_value("WOW,EFT"), ("EFT", "WOW"))
+        self.assertEqual(self.field.get_clean_value([]), ())
+
+    def test_clean_tuple(self):
+        value = ("EFT", "WOW")
+        self.assertIs(self.field.get_clean_value(value), value)
+
+    def test_unclean_tuple(self):
+        self.assertEqual(self.field.get_clean_value(("WOW", "EFT")), ("EFT", "WOW"))
+        self.assertEqual(self.field.get_clean_value(("EFT", "EFT")), ("EFT",))
+
+    def test_cached(self):
+        self.assertIs(
+            self.field.get_clean_value("WOW,EFT"),
+            self.field.get_clean_value("WOW,EFT"),
+        )
+
+    def test_instance_value(self):
+        item = Item(games=["WOW", "EFT"])
+        self.assertEqual(item.__dict__["games"], ("EFT", "WOW"))
+        self.assertEqual(item.games, ["EFT", "WOW"])
+        self.assertIsInstance(item.games[0], Game)
+
+    def test_bitmask_cache_reset(self):
+        field = GameField(multiple=True, storage="bitmask")
+        self.assertEqual(field.get_clean_value(1), ("WOW",))
+        with self.settings(GAMES_OVERRIDE={"NEW": {"name": "New Game", "bit": 0}}):
+            self.assertEqual(field.get_clean_value(1), ("NEW",))
+        self.assertEqual(field.get_clean_value(1), ("WOW",))
+
+
+class TestMultipleDescriptor(SimpleTestCase):
+    def test_games_cached(self):
+        item = Item(games=["WOW", "EFT"])
+        self.assertIs(item.games[0], item.games[0])
+        item.games = ["POE"]
+        self.assertEqual(item.games, ["POE"])
+
+    def test_pickle(self):
+        item = Item(games=["WOW", "EFT"])
+        self.assertEqual(item.games, ["EFT", "WOW"])
+        loaded = pickle.loads(pickle.dumps(item))
+        self.assertEqual(loaded.__dict__["_games_games"].games, [])
+        self.assertEqual(loaded.games, ["EFT", "WOW"])
+        self.assertIs(loaded.games[1], Game.interned("WOW"))
+        self.assertIn("WOW", set(loaded.games))
+
+
+class TestDisplay(SimpleTestCase):
+    def test_get_display(self):
+        self.assertEqual(Item(game="WOW").get_game_display(), "World of Warcraft")
+        self.assertEqual(Item(game="XX").get_game_display(), "XX")
+        self.assertEqual(Item(game="").get_game_display(), "")
+
+    def test_names_per_language(self):
+        with translation.override("fr"):
+            names = games.translated_names()
+            self.assertIs(games.translated_names(), names)
+        self.assertIsNot(games.translated_names(), names)
+
+    def test_get_display_without_choices(self):
+        Item(game="WOW").get_game_display()
+        with mock.patch.object(
+            Games, "_build_choices", side_effect=AssertionError
+        ), mock.patch.object(Games, "translate_pair", side_effect=AssertionError):
+            self.assertEqual(Item(game="EFT").get_game_display(), "Escape from Tarkov")
+
+    def test_flatchoices_cached(self):
+        field = Item._meta.get_field("game")
+        self.assertIs(field.flatchoices, field.flatchoices)
+        self.assertIn(("WOW", "World of Warcraft"), field.flatchoices)
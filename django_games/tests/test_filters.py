@@ -0,0 +1,134 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_games.filters import GameFilter
+from django_games.tests.models import Item
+
+
+class CachedGameFilter(GameFilter):
+    facet_cache_timeout = 60
+
+
+class ItemAdmin(admin.ModelAdmin):
+    list_filter = [("game", GameFilter), "name"]
+    show_facets = admin.ShowFacets.ALLOW
+
+
+class TestGameFilter(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin", "", "admin")
+        Item.objects.bulk_create(
+            [
+                Item(name="a", game="WOW"),
+                Item(name="b", game="WOW"),
+                Item(name="a", game="EFT"),
+                Item(name="a", game="POE"),
+            ]
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def displays(self, params=None, model_admin_class=ItemAdmin):
+        request = RequestFactory().get("/", params or {})
+        request.user = self.user
+        model_admin = model_admin_class(Item, admin.site)
+        changelist = model_admin.get_changelist_instance(request)
+        spec = changelist.filter_specs[0]
+        return [str(choice["display"]) for choice in spec.choices(changelist)]
+
+    def test_choices(self):
+        self.assertEqual(
+            self.displays(),
+            ["All", "Escape from Tarkov", "Path of Exile", "World of Warcraft"],
+        )
+
+    def test_facets(self):
+        self.assertEqual(
+            self.displays({"_facets": "True"}),
+            [
+                "All",
+                "Escape from Tarkov (1)",
+                "Path of Exile (1)",
+                "World of Warcraft (2)",
+            ],
+        )
+
+    def test_facets_other_filters(self):
+        self.assertEqual(
+            self.displays({"_facets": "True", "name": "a", "game": "WOW"}),
+            [
+                "All",
+                "Escape from Tarkov (1)",
+                "Path of Exile (1)",
+                "World of Warcraft (1)",
+            ],
+        )
+
+    def test_facets_always(self):
+        class AlwaysAdmin(ItemAdmin):
+            show_facets = admin.ShowFacets.ALWAYS
+
+        self.assertIn("World of Warcraft (2)", self.displays({}, AlwaysAdmin))
+
+    def test_facets_never(self):
+        class NeverAdmin(ItemAdmin):
+            show_facets = admin.ShowFacets.NEVER
+
+        self.assertIn(
+            "World of Warcraft", self.displays({"_facets": "True"}, NeverAdmin)
+        )
+
+    def test_facets_cached(self):
+        class CachedAdmin(ItemAdmin):
+            list_filter = [("game", CachedGameFilter), "name"]
+
+        self.assertIn(
+            "World of Warcraft (2)", self.displays({"_facets": "True"}, CachedAdmin)
+        )
+        Item.objects.create(name="c", game="WOW")
+        self.assertIn(
+            "World of Warcraft (2)", self.displays({"_facets": "True"}, CachedAdmin)
+        )
+        # Ordering doesn't change the counts, so shares the cached ones.
+        self.assertIn(
+            "World of Warcraft (2)",
+            self.displays({"_facets": "True", "o": "1"}, CachedAdmin),
+        )
+        # Other filters are counted separately.
+        self.assertIn(
+            "World of Warcraft (1)",
+            self.displays({"_facets": "True", "name": "c"}, CachedAdmin),
+        )
+
+    def test_facets_one_query(self):
+        request = RequestFactory().get("/", {"_facets": "True"})
+        request.user = self.user
+        changelist = ItemAdmin(Item, admin.site).get_changelist_instance(request)
+        spec = changelist.filter_specs[0]
+        with CaptureQueriesContext(connection) as queries:
+            counts = spec.get_facet_queryset(changelist)
+        self.assertEqual(len(queries), 1)
+        self.assertIn("GROUP BY", queries[0]["sql"])
+        self.assertEqual(counts, {"WOW": 2, "EFT": 1, "POE": 1})
+
+    def test_multiple_field(self):
+        Item.objects.create(name="m", games=["EFT", "WOW"])
+        Item.objects.create(name="m", games=["WOW"])
+
+        class MultipleAdmin(ItemAdmin):
+            list_filter = [("games", GameFilter), "name"]
+
+        self.assertEqual(
+            self.displays({"_facets": "True", "name": "m"}, MultipleAdmin),
+            ["All", "Escape from Tarkov (1)", "World of Warcraft (2)"],
+        )
+        self.assertEqual(
+            self.displays({}, MultipleAdmin),
+            ["All", "Escape from Tarkov", "World of Warcraft"],
+        )
@@ -0,0 +1,58 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from django_games.tests.models import Item
+
+
+class ItemForm(forms.ModelForm):
+    class Meta:
+        model = Item
+        fields = ["game", "games"]
+
+
+class NarrowItemForm(ItemForm):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["game"].choices = [("EFT", "Escape from Tarkov")]
+        self.fields["games"].choices = [("EFT", "Escape from Tarkov")]
+
+
+class TestGameFormField(TestCase):
+    def test_valid(self):
+        form = ItemForm({"game": "WOW", "games": ["EFT", "POE"]})
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_invalid(self):
+        form = ItemForm({"game": "XX", "games": ["EFT", "XX"]})
+        self.assertFalse(form.is_valid())
+        self.assertEqual(set(form.errors), {"game", "games"})
+
+    def test_blank(self):
+        self.assertTrue(ItemForm({"game": "", "games": []}).is_valid())
+
+    def test_uses_games_codes(self):
+        self.assertIsNotNone(ItemForm().fields["game"].games)
+
+    def test_narrowed_choices(self):
+        form = NarrowItemForm({"game": "WOW", "games": ["WOW"]})
+        self.assertFalse(form.is_valid())
+        self.assertEqual(set(form.errors), {"game", "games"})
+        form = NarrowItemForm({"game": "EFT", "games": ["EFT"]})
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_explicit_choices(self):
+        field = Item._meta.get_field("game").formfield(choices=[("EFT", "EFT")])
+        self.assertIsNone(field.games)
+        self.assertFalse(field.valid_value("WOW"))
+
+
+class TestModelValidation(TestCase):
+    def test_multiple_invalid(self):
+        item = Item(games=["EFT", "QQ"])
+        with self.assertRaises(ValidationError) as cm:
+            item.full_clean()
+        self.assertIn("games", cm.exception.message_dict)
+
+    def test_multiple_valid(self):
+        Item(game="WOW", games=["EFT", "POE"]).full_clean()
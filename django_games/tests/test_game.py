@@ -0,0 +1,89 @@
+import os
+import pickle
+import subprocess
+import sys
+
+from django.test import SimpleTestCase
+
+import django_games
+from django_games import games
+from django_games.fields import Game
+
+
+class TestGame(SimpleTestCase):
+    def test_interned(self):
+        self.assertIs(Game.interned("wow"), Game.interned("WOW"))
+        self.assertIsNot(Game.interned("WOW"), Game.interned("WOW", str_attr="name"))
+
+    def test_immutable(self):
+        game = Game.interned("WOW")
+        with self.assertRaises(AttributeError):
+            game.code = "EFT"
+        with self.assertRaises(AttributeError):
+            game.custom_games = games
+        with self.assertRaises(AttributeError):
+            del game.code
+        self.assertEqual(game.code, "WOW")
+
+    def test_escape_copy(self):
+        game = Game.interned("WOW")
+        escaped = game.escape
+        self.assertIsNot(escaped, game)
+        self.assertEqual(escaped, game)
+        self.assertTrue(escaped._escape)
+        self.assertFalse(game._escape)
+        self.assertIs(Game.interned("WOW"), game)
+
+    def test_pickle(self):
+        game = Game("wow", str_attr="name")
+        loaded = pickle.loads(pickle.dumps(game))
+        self.assertEqual(loaded, game)
+        self.assertEqual(str(loaded), "World of Warcraft")
+
+    def test_pickle_hash(self):
+        game = pickle.loads(pickle.dumps(Game.interned("WOW")))
+        self.assertIn(game, {"WOW"})
+        self.assertEqual({"WOW": 1}.get(game), 1)
+        self.assertEqual(hash(game), hash("WOW"))
+
+    def test_pickle_other_process(self):
+        # String hashes are seeded per process, so unpickling a game in
+        # another process must not reuse this process's hash.
+        script = (
+            "import django, pickle, sys;"
+            "django.setup();"
+            "from django_games.fields import Game;"
+            "{}"
+        )
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "django_games.tests.settings",
+            "PYTHONPATH": os.path.dirname(os.path.dirname(django_games.__file__)),
+        }
+        dumped = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                script.format(
+                    "sys.stdout.buffer.write(pickle.dumps(Game.interned('WOW')))"
+                ),
+            ],
+            env={**env, "PYTHONHASHSEED": "1"},
+            capture_output=True,
+            check=True,
+        ).stdout
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                script.format(
+                    "g = pickle.loads(sys.stdin.buffer.read());"
+                    "print(g in {'WOW'}, {'WOW': 1}.get(g))"
+                ),
+            ],
+            env={**env, "PYTHONHASHSEED": "2"},
+            input=dumped,
+            capture_output=True,
+            check=True,
+        ).stdout
+        self.assertEqual(loaded.split(), [b"True", b"1"])
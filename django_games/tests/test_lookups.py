@@ -0,0 +1,137 @@
+import re
+
+from django.test import TestCase
+
+from django_games.tests.models import BitmaskItem, Item
+
+
+class TestDelimitedLookups(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.eft2 = Item.objects.create(games=["EFT2", "WOW"])
+        cls.eft = Item.objects.create(games=["EFT", "POE"])
+        cls.d4 = Item.objects.create(games=["D4"])
+        cls.empty = Item.objects.create(games=[])
+        cls.everything = {cls.eft2, cls.eft, cls.d4, cls.empty}
+
+    def filter(self, **kwargs):
+        return set(Item.objects.filter(**kwargs))
+
+    def exclude(self, **kwargs):
+        return set(Item.objects.exclude(**kwargs))
+
+    def test_contains_game_whole_code(self):
+        self.assertEqual(self.filter(games__contains_game="EFT"), {self.eft})
+        self.assertEqual(self.filter(games__contains_game="EFT2"), {self.eft2})
+
+    def test_contains_game_exclude(self):
+        self.assertEqual(
+            self.exclude(games__contains_game="EFT"), self.everything - {self.eft}
+        )
+
+    def test_contains_any_game(self):
+        self.assertEqual(
+            self.filter(games__contains_any_game=["EFT", "D4"]), {self.eft, self.d4}
+        )
+        self.assertEqual(
+            self.filter(games__contains_any_game="WOW,POE"), {self.eft2, self.eft}
+        )
+
+    def test_contains_all_games(self):
+        self.assertEqual(
+            self.filter(games__contains_all_games=["POE", "EFT"]), {self.eft}
+        )
+        self.assertEqual(self.filter(games__contains_all_games=["EFT", "WOW"]), set())
+
+    def test_empty_list(self):
+        self.assertEqual(self.filter(games__contains_all_games=[]), self.everything)
+        self.assertEqual(self.exclude(games__contains_all_games=[]), set())
+        self.assertEqual(self.filter(games__contains_any_game=[]), set())
+        self.assertEqual(self.exclude(games__contains_any_game=[]), self.everything)
+
+
+class TestDelimitedLookupsBitmask(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.both = BitmaskItem.objects.create(games=["WOW", "ARC"])
+        cls.eft = BitmaskItem.objects.create(games=["EFT"])
+
+    def filter(self, **kwargs):
+        return set(BitmaskItem.objects.filter(**kwargs))
+
+    def test_remapped(self):
+        self.assertEqual(self.filter(games__contains_game="ARC"), {self.both})
+        self.assertEqual(
+            self.filter(games__contains_any_game=["ARC", "EFT"]), {self.both, self.eft}
+        )
+        self.assertEqual(
+            self.filter(games__contains_all_games=["ARC", "WOW"]), {self.both}
+        )
+
+    def test_sql(self):
+        sql = str(BitmaskItem.objects.filter(games__contains_game="ARC").query)
+        self.assertIn("&", sql)
+        self.assertNotIn("LIKE", sql)
+
+
+class TestNameLookups(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Item.objects.bulk_create(
+            Item(game=code) for code in ["WOW", "HC", "D4", "POE", "POE2", "EFT"]
+        )
+
+    def codes(self, **kwargs):
+        return set(
+            Item.objects.filter(**kwargs).values_list("game", flat=True)
+        )
+
+    def test_game_contains(self):
+        self.assertEqual(self.codes(game__game_contains="of Exile"), {"POE", "POE2"})
+        self.assertEqual(self.codes(game__game_contains="of exile"), set())
+
+    def test_game_icontains(self):
+        self.assertEqual(self.codes(game__game_icontains="of exile"), {"POE", "POE2"})
+
+    def test_game_startswith(self):
+        self.assertEqual(self.codes(game__game_startswith="World"), {"WOW", "HC"})
+        self.assertEqual(self.codes(game__game_startswith="world"), set())
+
+    def test_game_istartswith(self):
+        self.assertEqual(self.codes(game__game_istartswith="world"), {"WOW", "HC"})
+
+    def test_game_endswith(self):
+        self.assertEqual(self.codes(game__game_endswith="Exile"), {"POE"})
+        self.assertEqual(self.codes(game__game_endswith="exile"), set())
+
+    def test_game_iendswith(self):
+        self.assertEqual(self.codes(game__game_iendswith="exile 2"), {"POE2"})
+
+    def test_two_letter_code(self):
+        self.assertEqual(self.codes(game__game_contains="D4"), {"D4"})
+        self.assertEqual(self.codes(game__game_icontains="hc"), {"HC"})
+
+    def test_regex_characters(self):
+        self.assertEqual(self.codes(game__game_contains="Diablo I."), set())
+        self.assertEqual(self.codes(game__game_contains="(Exile"), set())
+
+    def test_matches_regex_lookups(self):
+        patterns = {
+            "contains": "{}",
+            "startswith": "^{}",
+            "endswith": "{}$",
+        }
+        for text in ["Exile", "of ", "v", "Warcraft Classic", "2"]:
+            for match, pattern in patterns.items():
+                for i in ["", "i"]:
+                    with self.subTest(text=text, lookup=f"game_{i}{match}"):
+                        self.assertEqual(
+                            self.codes(**{f"game__game_{i}{match}": text}),
+                            self.codes(
+                                **{
+                                    f"game__game_{i}regex": pattern.format(
+                                        re.escape(text)
+                                    )
+                                }
+                            ),
+                        )
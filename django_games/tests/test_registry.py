@@ -0,0 +1,139 @@
+import random
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+
+from django_games import Games, collation_key
+
+
+class TestRegistryThreads(SimpleTestCase):
+    threads = 16
+    iterations = 500
+
+    def test_concurrent_lookups_and_resets(self):
+        games = Games()
+        expected = list(games)
+        errors = []
+
+        def worker(seed):
+            rand = random.Random(seed)
+            try:
+                for _ in range(self.iterations):
+                    r = rand.random()
+                    if r < 0.05:
+                        del games.games
+                    elif r < 0.35:
+                        self.assertEqual(list(games), expected)
+                    elif r < 0.65:
+                        self.assertEqual(games.by_name("path of exile"), "POE")
+                    else:
+                        self.assertEqual(games.alpha2("eft"), "EFT")
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        workers = [
+            threading.Thread(target=worker, args=(seed,))
+            for seed in range(self.threads)
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+class TestOptions(SimpleTestCase):
+    def test_snapshot_only_has_per_object_options(self):
+        games = Games()
+        games.get_option("first")
+        self.assertNotIn("warm", games._options)
+        self.assertNotIn("collation_table", games._options)
+
+    def test_setting_only_option(self):
+        self.assertIs(Games().get_option("warm"), False)
+
+    def test_option_attribute(self):
+        class FirstGames(Games):
+            first = ["POE"]
+
+        self.assertEqual(FirstGames().get_option("first"), ["POE"])
+
+    def test_option_setting_changed(self):
+        games = Games()
+        self.assertEqual(games.get_option("first"), [])
+        with self.settings(GAMES_FIRST=["WOW"]):
+            self.assertEqual(games.get_option("first"), ["WOW"])
+        self.assertEqual(games.get_option("first"), [])
+
+
+class TestResolveMany(SimpleTestCase):
+    def test_alpha2_many(self):
+        self.assertEqual(
+            Games().alpha2_many(["wow", 509, "WOW", ["unhashable"], None]),
+            ["WOW", "EFT", "WOW", "", ""],
+        )
+
+    def test_resolved_once(self):
+        calls = []
+
+        def resolve(code):
+            calls.append(code)
+            return code
+
+        Games()._resolve_many(resolve, ["WOW", "WOW", ["X"], ["X"]])
+        self.assertEqual(calls, ["WOW", ["X"], ["X"]])
+
+    def test_resolve_type_error(self):
+        calls = []
+
+        def resolve(code):
+            calls.append(code)
+            raise TypeError("Bad code.")
+
+        with self.assertRaises(TypeError):
+            Games()._resolve_many(resolve, ["WOW"])
+        self.assertEqual(calls, ["WOW"])
+
+
+class TestByNameFuzzy(SimpleTestCase):
+    def test_misspelled(self):
+        code, score = Games().by_name_fuzzy("Path of Exil 2")
+        self.assertEqual(code, "POE2")
+        self.assertGreater(score, 0.8)
+
+    def test_alternate_wording(self):
+        self.assertEqual(Games().by_name_fuzzy("wow classic hardcore")[0], "HC")
+
+    def test_below_threshold(self):
+        self.assertEqual(Games().by_name_fuzzy("xyz"), ("", 0.0))
+        self.assertEqual(Games().by_name_fuzzy("tarkov"), ("", 0.0))
+
+    def test_threshold(self):
+        games = Games()
+        code, score = games.by_name_fuzzy("wow classic hardcore")
+        self.assertEqual(
+            games.by_name_fuzzy("wow classic hardcore", threshold=score), (code, score)
+        )
+        self.assertEqual(
+            games.by_name_fuzzy("wow classic hardcore", threshold=score + 0.01),
+            ("", 0.0),
+        )
+        self.assertEqual(games.by_name_fuzzy("tarkov", threshold=0.1)[0], "EFT")
+
+    def test_by_name(self):
+        games = Games()
+        self.assertEqual(games.by_name("Path of Exil 2"), "")
+        self.assertEqual(games.by_name("Path of Exil 2", fuzzy=True), "POE2")
+        self.assertEqual(games.by_name("Path of Exile", fuzzy=True), "POE")
+
+
+class TestCollation(SimpleTestCase):
+    def test_unknown_collation(self):
+        with self.assertRaises(ImproperlyConfigured) as cm:
+            collation_key("Diablo", "klingon")
+        self.assertIsNone(cm.exception.__cause__)
+        self.assertTrue(cm.exception.__suppress_context__)
+
+    def test_ascii_collation(self):
+        self.assertEqual(collation_key("Élan", "ascii"), collation_key("Elan", "ascii"))
@@ -0,0 +1,67 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from django_games.serializer_fields import GameField, GameListField
+
+
+class StrictGameField(GameField):
+    def to_internal_value(self, data):
+        raise DjangoValidationError("Not allowed.")
+
+
+class TestGameListField(SimpleTestCase):
+    def test_to_representation(self):
+        field = GameListField(child=GameField())
+        self.assertEqual(field.to_representation(["wow", "EFT"]), ["WOW", "EFT"])
+
+    def test_to_representation_dict(self):
+        field = GameListField(child=GameField(game_dict=True))
+        self.assertEqual(
+            field.to_representation(["wow"]),
+            [{"code": "WOW", "name": "World of Warcraft"}],
+        )
+
+    def test_to_representation_none(self):
+        field = GameListField(child=GameField(name_only=True))
+        self.assertEqual(
+            field.to_representation(["WOW", None]), ["World of Warcraft", None]
+        )
+
+    def test_to_internal_value(self):
+        field = GameListField(child=GameField())
+        self.assertEqual(
+            field.to_internal_value(["wow", "Path of Exile"]), ["WOW", "POE"]
+        )
+
+    def test_to_internal_value_invalid(self):
+        field = GameListField(child=GameField())
+        with self.assertRaises(serializers.ValidationError) as cm:
+            field.to_internal_value(["wow", "nope"])
+        self.assertEqual(list(cm.exception.detail), [1])
+
+    def test_to_internal_value_django_validation_error(self):
+        field = GameListField(child=StrictGameField())
+        with self.assertRaises(serializers.ValidationError) as cm:
+            field.to_internal_value(["wow", "nope"])
+        self.assertEqual(cm.exception.detail[1], ["Not allowed."])
+
+
+class TestGameFieldFuzzy(SimpleTestCase):
+    def test_not_fuzzy(self):
+        with self.assertRaises(serializers.ValidationError):
+            GameField().to_internal_value("Path of Exil 2")
+
+    def test_fuzzy(self):
+        field = GameField(fuzzy=True)
+        self.assertEqual(field.to_internal_value("Path of Exil 2"), "POE2")
+        self.assertEqual(field.to_internal_value("wow classic hardcore"), "HC")
+
+    def test_fuzzy_threshold(self):
+        field = GameField(fuzzy=0.7)
+        self.assertEqual(field.to_internal_value("Path of Exil 2"), "POE2")
+        with self.assertRaises(serializers.ValidationError):
+            field.to_internal_value("wow classic hardcore")
+
+    def test_exact_name_first(self):
+        self.assertEqual(GameField(fuzzy=0.7).to_internal_value("Diablo IV"), "D4")
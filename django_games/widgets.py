@@ -103,16 +103,9 @@ class GameSelectWidget(LazySelect):
         super().__init__(*args, **kwargs)
 
     def render(self, name, value, attrs=None, renderer=None):
-        from django_games.fields import Game
-
         attrs = attrs or {}
 
         # Render base <select>
         widget_render = super().render(name, value, attrs, renderer=renderer)
 
-        # Convert raw string into Game object (keeps name logic working)
-        game = value if isinstance(value, Game) else Game(value or "")
-
-        # Escape context active while rendering
-        with game.escape:
-            return mark_safe(self.layout.format(widget=widget_render))
+        return mark_safe(self.layout.format(widget=widget_render))